@@ -1,9 +1,16 @@
 import logging
+import os
+import pickle
 from typing import List, Optional, Dict, Any
 import time
+import uuid
 
+import faiss
+import numpy as np
 from langchain.schema import Document
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_core.embeddings import Embeddings
 
 # Configure logging
@@ -12,6 +19,68 @@ logger = logging.getLogger(__name__)
 # __________________________________________________________________________
 
 
+def configure_for_index_metric(vectorstore: FAISS) -> bool:
+    """
+    Match a FAISS store's query handling to its index metric.
+    Inner-product indexes hold unit-normalized vectors, so queries are
+    normalized too and scores are cosine similarities (higher is better).
+    Returns True if the index uses inner product.
+    """
+    if vectorstore.index.metric_type != faiss.METRIC_INNER_PRODUCT:
+        return False
+    
+    vectorstore.distance_strategy = DistanceStrategy.MAX_INNER_PRODUCT
+    # Set directly: the FAISS constructor warns when normalize_L2 is
+    # combined with a non-Euclidean strategy, though it is honoured
+    vectorstore._normalize_L2 = True
+    return True
+
+
+def load_vectorstore_mmap(path: str, embeddings: Embeddings) -> FAISS:
+    """
+    Load a store written by FAISS.save_local, memory-mapping what faiss allows.
+    faiss only maps the inverted lists of IVF indexes (the IVF-PQ tier used for
+    large corpora): their codes are paged in by the kernel as searches touch
+    them and shared between processes. Flat, SQ8 and HNSW indexes are still
+    read into the heap. Only the docstore and id mapping go through pickle.
+    """
+    index_path = os.path.join(path, "index.faiss")
+    try:
+        index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+    except Exception as e:
+        logger.warning(f"Could not memory-map FAISS index, reading it fully: {e}")
+        index = faiss.read_index(index_path)
+    
+    with open(os.path.join(path, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id
+    )
+
+
+def move_index_to_gpu(vectorstore: FAISS) -> bool:
+    """
+    Move a FAISS store's index onto the first GPU when one is available.
+    The CPU index is kept if there is no GPU, faiss lacks GPU support, or
+    the index type cannot be transferred. Returns True if the index moved.
+    """
+    if not hasattr(faiss, 'StandardGpuResources') or faiss.get_num_gpus() == 0:
+        return False
+    
+    try:
+        resources = faiss.StandardGpuResources()
+        vectorstore.index = faiss.index_cpu_to_gpu(resources, 0, vectorstore.index)
+        logger.info("FAISS index moved to GPU 0")
+        return True
+    except Exception as e:
+        logger.warning(f"Could not move FAISS index to GPU, using CPU index: {e}")
+        return False
+
+
 class VectorStoreManager:
     """
     High-Performance Vector Store Manager for RAG Systems
@@ -27,6 +96,19 @@ class VectorStoreManager:
     def __init__(self, embeddings: Embeddings):
         self.embeddings = embeddings
         self.vectorstore: Optional[FAISS] = None
+        self.on_gpu = False
+        
+        # Index selection by corpus size: exact flat search for small corpora,
+        # an HNSW graph for medium ones and compressed IVF-PQ for large ones
+        self.hnsw_min_documents = 2000
+        self.hnsw_m = 32
+        self.hnsw_ef_construction = 200
+        self.hnsw_ef_search = 64
+        self.ivfpq_min_documents = 10000
+        self.ivfpq_factory = "IVF100,PQ16"
+        self.ivfpq_nprobe = 10
+        # Store flat and HNSW vectors as 8-bit scalars: 4x less memory read per query
+        self.scalar_quantize = True
         
         # Performance metrics
         self.last_build_time = 0
@@ -45,16 +127,14 @@ class VectorStoreManager:
             start_time = time.time()
             
             # Documents are already chunked optimally by DocumentProcessor
-            # Create vector store directly for maximum performance
-            self.vectorstore = FAISS.from_documents(
-                documents=documents, 
-                embedding=self.embeddings
-            )
+            vectors = self._embed_documents(documents)
+            # Unit-normalize so inner product equals cosine similarity
+            faiss.normalize_L2(vectors)
             
-            # Performance optimization: build index for faster retrieval
-            if hasattr(self.vectorstore.index, 'nprobe'):
-                # Optimize search parameters for speed/accuracy balance
-                self.vectorstore.index.nprobe = min(10, len(documents) // 10)
+            # Performance optimization: pick the index type for the corpus size
+            index = self._build_index(vectors)
+            self.vectorstore = self._wrap_index(index, documents)
+            self.on_gpu = False
             
             self.last_build_time = time.time() - start_time
             self.document_count = len(documents)
@@ -66,6 +146,71 @@ class VectorStoreManager:
             logger.error(f"❌ Error creating vector store: {e}")
             return False
 
+    def _embed_documents(self, documents: List[Document]) -> np.ndarray:
+        """
+        Embed all documents in a single batched call
+        Texts are grouped by length to keep padding uniform within each batch,
+        then restored to document order
+        """
+        texts = [doc.page_content for doc in documents]
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        
+        sorted_vectors = np.asarray(
+            self.embeddings.embed_documents([texts[i] for i in order]), dtype='float32'
+        )
+        
+        vectors = np.empty_like(sorted_vectors)
+        vectors[order] = sorted_vectors
+        return vectors
+
+    def _build_index(self, vectors: np.ndarray) -> faiss.Index:
+        """Build a FAISS index suited to the number of vectors"""
+        count, dimension = vectors.shape
+        
+        if count >= self.ivfpq_min_documents:
+            index = faiss.index_factory(dimension, self.ivfpq_factory, faiss.METRIC_INNER_PRODUCT)
+            index.train(vectors)
+            # Optimize search parameters for speed/accuracy balance
+            index.nprobe = self.ivfpq_nprobe
+            index_type = self.ivfpq_factory
+        elif count >= self.hnsw_min_documents:
+            if self.scalar_quantize:
+                index = faiss.IndexHNSWSQ(
+                    dimension, faiss.ScalarQuantizer.QT_8bit, self.hnsw_m, faiss.METRIC_INNER_PRODUCT
+                )
+                index.train(vectors)
+                index_type = f"HNSW{self.hnsw_m},SQ8"
+            else:
+                index = faiss.IndexHNSWFlat(dimension, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+                index_type = f"HNSW{self.hnsw_m},Flat"
+            index.hnsw.efConstruction = self.hnsw_ef_construction
+            index.hnsw.efSearch = self.hnsw_ef_search
+        elif self.scalar_quantize:
+            index = faiss.IndexScalarQuantizer(
+                dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+            index.train(vectors)
+            index_type = "SQ8"
+        else:
+            index = faiss.IndexFlatIP(dimension)
+            index_type = "Flat"
+        
+        index.add(vectors)
+        logger.info(f"Built {index_type} index over {index.ntotal} vectors")
+        return index
+
+    def _wrap_index(self, index: faiss.Index, documents: List[Document]) -> FAISS:
+        """Wrap a populated FAISS index in a LangChain vector store"""
+        ids = [str(uuid.uuid4()) for _ in documents]
+        vectorstore = FAISS(
+            embedding_function=self.embeddings,
+            index=index,
+            docstore=InMemoryDocstore(dict(zip(ids, documents))),
+            index_to_docstore_id=dict(enumerate(ids))
+        )
+        configure_for_index_metric(vectorstore)
+        return vectorstore
+
     def save_vectorstore(self, path: str) -> bool:
         """Save vector store to disk"""
         if not self.vectorstore:
@@ -73,7 +218,16 @@ class VectorStoreManager:
             return False
 
         try:
-            self.vectorstore.save_local(path)
+            if self.on_gpu:
+                # GPU indexes cannot be serialized; save a CPU copy
+                gpu_index = self.vectorstore.index
+                self.vectorstore.index = faiss.index_gpu_to_cpu(gpu_index)
+                try:
+                    self.vectorstore.save_local(path)
+                finally:
+                    self.vectorstore.index = gpu_index
+            else:
+                self.vectorstore.save_local(path)
             logger.info(f"Vector store saved to {path}")
             return True
         except Exception as e:
@@ -84,9 +238,9 @@ class VectorStoreManager:
         """Load vector store from disk with performance optimization"""
         try:
             start_time = time.time()
-            self.vectorstore = FAISS.load_local(
-                path, self.embeddings, allow_dangerous_deserialization=True
-            )
+            self.vectorstore = load_vectorstore_mmap(path, self.embeddings)
+            configure_for_index_metric(self.vectorstore)
+            self.on_gpu = move_index_to_gpu(self.vectorstore)
             load_time = time.time() - start_time
             logger.info(f"✅ Vector store loaded in {load_time:.2f}s")
             return True
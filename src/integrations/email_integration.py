@@ -1,23 +1,112 @@
 import os
+import re
 import smtplib
 import logging
 import imaplib
 import email
+import email.policy
 import time
+import queue
+import select
 from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.header import decode_header
-from typing import List, Dict, Optional
+from email.header import decode_header, make_header
+from email.parser import BytesParser
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Signature markers that clearly indicate start of signature
+_DEFINITE_SIGNATURE_RE = re.compile('|'.join(f'(?:{marker})' for marker in [
+    r'^\*?Best Regards\*?$',
+    r'^\*?Regards\*?$',
+    r'^\*?Sincerely\*?$',
+    r'^\*?Best regards\*?$',
+    r'^\*?Kind regards\*?$',
+    r'^--$',
+    r'^___+$',
+    r'Sent from',
+    r'Tel:',
+    r'Phone:',
+    r'LinkedIn:',
+    r'Plot No',
+    r'Building',
+    r'Rwanda$',
+]), re.IGNORECASE)
+
+# Contact info patterns (emails, phones)
+_CONTACT_INFO_RE = re.compile('|'.join([
+    r'@\w+\.\w+',  # Email addresses
+    r'\+\d{1,4}[\s\-\(\)]*\d{6,}',  # Phone numbers
+    r'www\.',
+    r'https?://',
+]))
+
+# Name/title formatting lines (like "*Edward Ajayi | MSEAI 26'*")
+_NAME_TITLE_RE = re.compile(r'^\*.*\*$')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_GREETING_RE = re.compile(r'^(Hello,?|Hi,?)\s*', re.IGNORECASE)
+_TRAILING_THANKS_RE = re.compile(r'\s*(Thanks?|Thank you)\s*$', re.IGNORECASE)
+
+# Simple keyword-based HR question detection
+_HR_KEYWORD_RE = re.compile('|'.join(map(re.escape, [
+    'hr', 'human resources', 'policy', 'leave', 'vacation', 'pto',
+    'benefits', 'salary', 'hiring', 'onboarding', 'offboarding',
+    'travel', 'expense', 'handbook', 'guidelines', 'faculty',
+    'staff', 'employee', 'cmu africa', 'carnegie mellon'
+])))
+
+# UID item in a UID FETCH response envelope, e.g. b'5 (UID 1234 RFC822 {2048}'
+_FETCH_UID_RE = re.compile(rb'UID (\d+)')
+# Name of the data item whose literal follows an envelope, e.g. b'BODY[TEXT]<0> {4096}'
+_FETCH_ITEM_RE = re.compile(rb'(RFC822|BODY\[[^\]]*\](?:<\d+>)?) \{\d+\}$', re.IGNORECASE)
+
+# IMAP command arguments, pre-encoded so imaplib doesn't re-encode them on every call
+_ALL = b'ALL'
+_UNSEEN = b'UNSEEN'
+_SINCE = b'SINCE'
+_RFC822_FETCH = b'(RFC822)'
+_ADD_FLAGS = b'+FLAGS'
+_SEEN_FLAG = b'(\\Seen)'
+# Cheap first pass: headers plus the start of the body, without setting \Seen
+_PREVIEW_FETCH = b'(BODY.PEEK[HEADER.FIELDS (SUBJECT CONTENT-TRANSFER-ENCODING)] BODY.PEEK[TEXT]<0.4096>)'
+
+# Modern-policy parser for fetched messages; headers come back already decoded
+_EMAIL_PARSER = BytesParser(policy=email.policy.default)
+
+# SMTP replies that signal a temporary server-side condition worth retrying
+_TRANSIENT_SMTP_CODES = {421, 450, 454}
+
+
+@dataclass(slots=True)
+class IncomingEmail:
+    """Details extracted once from a parsed incoming email"""
+    sender: str
+    subject: str
+    message_id: str
+    body: str
+
 
 class EmailIntegration:
     """Email integration for the HR Policy Bot"""
     
+    __slots__ = (
+        'bot', 'smtp_server', 'smtp_port', 'username', 'password', 'imap_server',
+        'monitoring', 'monitor_thread', 'startup_time', 'startup_uid',
+        '_processed_lock', '_in_flight',
+        'recent_processed', 'recent_processed_size', 'worker_pool',
+        'response_cache', 'response_cache_size', 'response_cache_ttl', '_response_cache_lock',
+        'smtp_pool_size', '_smtp_pool', '_smtp_slots', 'smtp_max_retries', 'smtp_retry_delay',
+        'idle_timeout', 'idle_check_interval', 'imap_timeout', 'imap_max_backoff', 'fetch_batch_size',
+        'response_subject_prefix', 'bot_signature',
+    )
+    
     def __init__(self, bot):
         self.bot = bot
         self.smtp_server = os.getenv("SMTP_SERVER", "smtp.gmail.com")
@@ -28,7 +117,43 @@ class EmailIntegration:
         self.monitoring = False
         self.monitor_thread = None
         self.startup_time = None
-        self.processed_emails = set()
+        
+        # Processed messages are tracked by UID, which stays stable when other
+        # messages are expunged, unlike sequence numbers. Only mail above the
+        # startup UID is ever considered, so tracking is in memory.
+        self.startup_uid = 0  # Highest UID in the mailbox when monitoring started
+        self._processed_lock = threading.Lock()
+        self._in_flight = set()  # UIDs handed to workers but not yet recorded as processed
+        # Bounded LRU of processed UIDs
+        self.recent_processed: "OrderedDict[int, None]" = OrderedDict()
+        self.recent_processed_size = 50000
+        
+        # Emails are answered on worker threads so slow LLM calls and sends
+        # don't hold up the monitor thread watching for new mail
+        self.worker_pool = self._new_worker_pool()
+        
+        # LRU cache of normalized question -> (expiry, bot result). Only exact repeats
+        # hit: different HR questions can embed very close together. Entries expire
+        # so answers don't outlive a document update.
+        self.response_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self.response_cache_size = 512
+        self.response_cache_ttl = 3600  # seconds
+        self._response_cache_lock = threading.Lock()
+        
+        # Pool of authenticated SMTP sessions reused across sends, so each
+        # email doesn't pay for a fresh TLS handshake and login
+        self.smtp_pool_size = int(os.getenv("SMTP_POOL_SIZE", 5))
+        self._smtp_pool: queue.Queue = queue.Queue(maxsize=self.smtp_pool_size)
+        self._smtp_slots = threading.Semaphore(self.smtp_pool_size)
+        self.smtp_max_retries = 3
+        self.smtp_retry_delay = 1.0  # seconds, doubled after each retry
+        
+        # IMAP IDLE is re-issued before the server's 30 minute inactivity cutoff (RFC 2177)
+        self.idle_timeout = 1740  # seconds
+        self.idle_check_interval = 5  # seconds between checks for a stop request while idling
+        self.imap_timeout = 30  # seconds, for connecting and for each IMAP command
+        self.imap_max_backoff = 900  # seconds between reconnect attempts at most
+        self.fetch_batch_size = 100  # messages per FETCH; larger sets risk request size limits
         
         # Check if email credentials are configured
         if not self.username or not self.password:
@@ -52,8 +177,9 @@ For urgent matters, please contact HR directly.
     def send_email(self, to_email: str, subject: str, body: str, reply_to: Optional[str] = None) -> bool:
         """Send an email response"""
         try:
-            # Create message
-            msg = MIMEMultipart()
+            # Create message; replies are plain text only, so no multipart wrapper
+            full_body = body + self.bot_signature
+            msg = MIMEText(full_body, 'plain', 'utf-8')
             msg['From'] = self.username
             msg['To'] = to_email
             msg['Subject'] = f"{self.response_subject_prefix} {subject}"
@@ -62,15 +188,8 @@ For urgent matters, please contact HR directly.
                 msg['In-Reply-To'] = reply_to
                 msg['References'] = reply_to
             
-            # Add body with signature
-            full_body = body + self.bot_signature
-            msg.attach(MIMEText(full_body, 'plain'))
-            
             # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            self._send_with_retry(msg)
             
             logger.info(f"✅ Email sent successfully to {to_email}")
             return True
@@ -79,73 +198,158 @@ For urgent matters, please contact HR directly.
             logger.error(f"❌ Error sending email to {to_email}: {e}")
             return False
     
+    def _send_with_retry(self, msg):
+        """Send a message over a pooled SMTP session, retrying transient failures"""
+        delay = self.smtp_retry_delay
+        for attempt in range(self.smtp_max_retries + 1):
+            try:
+                with self._smtp_slots:
+                    server = self._acquire_smtp()
+                    try:
+                        server.send_message(msg)
+                    except smtplib.SMTPServerDisconnected:
+                        # Pooled session was dropped by the server; retry once on a fresh one
+                        self._discard_smtp(server)
+                        server = self._acquire_smtp()
+                        server.send_message(msg)
+                    finally:
+                        self._release_smtp(server)
+                return
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused) as e:
+                if attempt == self.smtp_max_retries or not self._is_transient_smtp_error(e):
+                    raise
+                logger.warning(f"Transient SMTP error, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+                delay *= 2
+    
+    def _is_transient_smtp_error(self, error: Exception) -> bool:
+        """Check whether an SMTP error is a temporary condition"""
+        if isinstance(error, smtplib.SMTPRecipientsRefused):
+            return all(code in _TRANSIENT_SMTP_CODES for code, _ in error.recipients.values())
+        return error.smtp_code in _TRANSIENT_SMTP_CODES
+    
+    def _acquire_smtp(self) -> smtplib.SMTP:
+        """Take an idle SMTP session from the pool, or open and authenticate a new one"""
+        try:
+            return self._smtp_pool.get_nowait()
+        except queue.Empty:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                server.starttls()
+                server.login(self.username, self.password)
+            except Exception:
+                self._discard_smtp(server)
+                raise
+            return server
+    
+    def _release_smtp(self, server: smtplib.SMTP):
+        """Return a session to the pool if it is still healthy"""
+        try:
+            if server.noop()[0] != 250:
+                raise smtplib.SMTPException("NOOP rejected")
+            self._smtp_pool.put_nowait(server)
+        except Exception:
+            self._discard_smtp(server)
+    
+    def _discard_smtp(self, server: smtplib.SMTP):
+        """Close an SMTP session without raising"""
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+    
     def process_question_email(self, question: str, sender_email: str, original_subject: str, message_id: Optional[str] = None):
         """Process a question and send email response"""
+        response_subject = f"Re: {original_subject}" if original_subject else "HR Policy Information"
+        
         try:
             # Get answer from the bot using proper async handling
             result = self._get_bot_response(question)
             
             if result and result.get("answer") and result["answer"] != "No QA chain available. Please run setup first.":
-                answer = result["answer"]
-                source_docs = result.get("source_documents", [])
-                
                 # Format the response for email
-                formatted_response = self._format_email_response(question, answer, source_docs)
-                
-                # Send response
-                response_subject = f"Re: {original_subject}" if original_subject else "HR Policy Information"
-                self.send_email(sender_email, response_subject, formatted_response, message_id)
-                
+                response = self._format_email_response(question, result["answer"], result.get("source_documents", []))
             else:
-                # Send fallback response
-                fallback_response = self._create_fallback_response(question)
-                response_subject = f"Re: {original_subject}" if original_subject else "HR Policy Information"
-                self.send_email(sender_email, response_subject, fallback_response, message_id)
+                # Fallback response when the bot has no answer
+                response = self._create_fallback_response(question)
                 
         except Exception as e:
             logger.error(f"Error processing question email: {e}")
-            # Send error response
-            error_response = self._create_error_response(question)
-            response_subject = f"Re: {original_subject}" if original_subject else "HR Policy Information"
-            self.send_email(sender_email, response_subject, error_response, message_id)
+            response = self._create_error_response(question)
+        
+        self.send_email(sender_email, response_subject, response, message_id)
     
     def _get_bot_response(self, question: str) -> dict:
         """Get response from bot using synchronous approach"""
         try:
+            # Serve repeated questions from cache
+            cache_key = _WHITESPACE_RE.sub(' ', question.lower().strip())
+            cached = self._lookup_cached_response(cache_key)
+            if cached is not None:
+                logger.info("📧 Answered email question from response cache")
+                return cached
+            
             # Use the synchronous fast_answer method directly for better reliability
             if hasattr(self.bot, 'fast_answer'):
                 result = self.bot.fast_answer(question, platform="email")
-                return result
             else:
                 logger.error("Bot does not have fast_answer method")
                 return None
             
+            # Only real answers are cached, never errors or fallbacks; fast_answer's
+            # error path still returns an apology as "answer", but only its success
+            # path reports performance timings
+            if result and result.get("answer") and "performance" in result and not result.get("error"):
+                self._cache_response(cache_key, result)
+            return result
+            
         except Exception as e:
             logger.error(f"Error getting bot response: {e}")
             return None
     
+    def _lookup_cached_response(self, cache_key: str) -> Optional[dict]:
+        """Find a cached result for a normalized question"""
+        with self._response_cache_lock:
+            cached = self.response_cache.get(cache_key)
+            if cached is None:
+                return None
+            expiry, result = cached
+            if expiry <= time.monotonic():
+                del self.response_cache[cache_key]
+                return None
+            self.response_cache.move_to_end(cache_key)
+            return result
+    
+    def _cache_response(self, cache_key: str, result: dict):
+        """Store a bot result, evicting the least recently used entry when full"""
+        with self._response_cache_lock:
+            self.response_cache[cache_key] = (time.monotonic() + self.response_cache_ttl, result)
+            self.response_cache.move_to_end(cache_key)
+            if len(self.response_cache) > self.response_cache_size:
+                self.response_cache.popitem(last=False)
+    
     def _format_email_response(self, question: str, answer: str, source_docs: list) -> str:
         """Format the response for email using markdown"""
-        response = f"""Hello,
+        parts = [f"""Hello,
 
 Thank you for your HR policy question: **"{question}"**
 
 {answer}
-"""
+"""]
         
         # Add source documents if available
         if source_docs:
-            response += "\n\n## Sources and Additional Resources\n"
+            parts.append("\n\n## Sources and Additional Resources\n")
             for i, doc in enumerate(source_docs, 1):
                 source = doc.metadata.get('source', 'Unknown')
                 if source.startswith('http'):
-                    response += f"{i}. [{source}]({source})\n"
+                    parts.append(f"{i}. [{source}]({source})\n")
                 else:
-                    response += f"{i}. {source}\n"
+                    parts.append(f"{i}. {source}\n")
         
-        response += "\nIf you need further assistance, please feel free to contact the HR department directly."
+        parts.append("\nIf you need further assistance, please feel free to contact the HR department directly.")
         
-        return response
+        return ''.join(parts)
     
     def _create_fallback_response(self, question: str) -> str:
         """Create a fallback response when the bot can't answer"""
@@ -177,87 +381,55 @@ I encountered a technical issue while processing your request. Please try again
 We apologize for any inconvenience.
 """
     
-    def start_email_monitoring(self, check_interval: int = 60):
-        """Start monitoring for new emails (basic implementation)"""
-        if self.monitoring:
-            logger.info("Email monitoring is already running")
-            return
-        
-        self.monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_emails, args=(check_interval,))
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
-        logger.info(f"📧 Started email monitoring (checking every {check_interval} seconds)")
-    
     def stop_email_monitoring(self):
-        """Stop email monitoring"""
+        """Stop email monitoring, finish queued replies and close pooled SMTP sessions"""
         self.monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        
+        # Replies already handed to workers are sent before we report stopped
+        if self.worker_pool is not None:
+            self.worker_pool.shutdown(wait=True)
+            self.worker_pool = None
+        
+        while True:
+            try:
+                self._discard_smtp(self._smtp_pool.get_nowait())
+            except queue.Empty:
+                break
+        
         logger.info("📧 Stopped email monitoring")
     
-    def _monitor_emails(self, check_interval: int):
-        """Monitor for new emails (basic implementation)"""
-        logger.info("Email monitoring started...")
+    def _new_worker_pool(self) -> ThreadPoolExecutor:
+        """Create the thread pool that answers fetched emails"""
+        return ThreadPoolExecutor(
+            max_workers=int(os.getenv("EMAIL_WORKERS", 4)), thread_name_prefix='email'
+        )
+    
+    def _parse_incoming_email(self, email_message) -> IncomingEmail:
+        """Extract sender, subject, message id and question body from a parsed email"""
+        # Extract email details
+        sender = str(email_message.get('From', ''))
+        subject = str(email_message.get('Subject', ''))
+        message_id = str(email_message.get('Message-ID', ''))
         
-        while self.monitoring:
-            try:
-                # Connect to IMAP server
-                with imaplib.IMAP4_SSL(self.imap_server) as imap:
-                    imap.login(self.username, self.password)
-                    imap.select('INBOX')
-                    
-                    # Search for unread emails
-                    status, messages = imap.search(None, 'UNSEEN')
-                    
-                    if status == 'OK' and messages[0]:
-                        email_ids = messages[0].split()
-                        
-                        for email_id in email_ids:
-                            try:
-                                # Fetch email
-                                status, msg_data = imap.fetch(email_id, '(RFC822)')
-                                
-                                if status == 'OK':
-                                    email_body = msg_data[0][1]
-                                    email_message = email.message_from_bytes(email_body)
-                                    
-                                    # Process the email
-                                    self._process_incoming_email(email_message)
-                                    
-                                    # Mark as read
-                                    imap.store(email_id, '+FLAGS', '\\Seen')
-                                    
-                            except Exception as e:
-                                logger.error(f"Error processing email {email_id}: {e}")
-                    
-            except Exception as e:
-                logger.error(f"Error in email monitoring: {e}")
-            
-            # Wait before next check
-            time.sleep(check_interval)
+        # Decode subject only if it still carries MIME encoded-words; plain
+        # subjects (the usual case) need no RFC 2047 parsing
+        if '=?' in subject:
+            subject = str(make_header(decode_header(subject)))
+        
+        # Extract email body
+        body = self._extract_email_body(email_message)
+        
+        return IncomingEmail(sender=sender, subject=subject, message_id=message_id, body=body)
     
-    def _process_incoming_email(self, email_message):
+    def _process_incoming_email(self, incoming: IncomingEmail):
         """Process an incoming email"""
         try:
-            # Extract email details
-            sender = email_message.get('From', '')
-            subject = email_message.get('Subject', '')
-            message_id = email_message.get('Message-ID', '')
-            
-            # Decode subject if needed
-            if subject:
-                decoded_subject = decode_header(subject)[0]
-                if isinstance(decoded_subject[0], bytes):
-                    subject = decoded_subject[0].decode(decoded_subject[1] or 'utf-8')
-            
-            # Extract email body
-            body = self._extract_email_body(email_message)
-            
             # Check if this is a potential HR question
-            if self._is_hr_question(subject, body):
-                logger.info(f"Processing HR question from {sender}: {subject}")
-                self.process_question_email(body, sender, subject, message_id)
+            if self._is_hr_question(incoming.subject, incoming.body):
+                logger.info(f"Processing HR question from {incoming.sender}: {incoming.subject}")
+                self.process_question_email(incoming.body, incoming.sender, incoming.subject, incoming.message_id)
             
         except Exception as e:
             logger.error(f"Error processing incoming email: {e}")
@@ -267,12 +439,14 @@ We apologize for any inconvenience.
         body = ""
         
         if email_message.is_multipart():
-            for part in email_message.walk():
-                if part.get_content_type() == "text/plain":
-                    body = part.get_payload(decode=True).decode('utf-8', errors='ignore')
-                    break
+            # get_body picks the text/plain body part without visiting attachments
+            part = email_message.get_body(preferencelist=('plain',))
         else:
-            body = email_message.get_payload(decode=True).decode('utf-8', errors='ignore')
+            part = email_message
+        
+        payload = part.get_payload(decode=True) if part is not None else None
+        if payload:
+            body = payload.decode('utf-8', errors='ignore')
         
         # Clean the email body to extract only the actual question
         cleaned_body = self._extract_question_from_email(body.strip())
@@ -280,34 +454,6 @@ We apologize for any inconvenience.
     
     def _extract_question_from_email(self, email_body: str) -> str:
         """Extract only the actual question from email, removing signatures and metadata"""
-        import re
-        
-        # Signature markers that clearly indicate start of signature
-        definite_signature_markers = [
-            r'^\*?Best Regards\*?$',
-            r'^\*?Regards\*?$', 
-            r'^\*?Sincerely\*?$',
-            r'^\*?Best regards\*?$',
-            r'^\*?Kind regards\*?$',
-            r'^--$',
-            r'^___+$',
-            r'Sent from',
-            r'Tel:',
-            r'Phone:',
-            r'LinkedIn:',
-            r'Plot No',
-            r'Building',
-            r'Rwanda$',
-        ]
-        
-        # Contact info patterns (emails, phones)
-        contact_patterns = [
-            r'@\w+\.\w+',  # Email addresses
-            r'\+\d{1,4}[\s\-\(\)]*\d{6,}',  # Phone numbers
-            r'www\.',
-            r'https?://',
-        ]
-        
         lines = email_body.split('\n')
         question_lines = []
         signature_started = False
@@ -320,10 +466,10 @@ We apologize for any inconvenience.
                 continue
             
             # Check if this line is definitely a signature marker
-            is_definite_signature = any(re.search(marker, line, re.IGNORECASE) for marker in definite_signature_markers)
+            is_definite_signature = _DEFINITE_SIGNATURE_RE.search(line) is not None
             
             # Check if this line contains contact info
-            is_contact_info = any(re.search(pattern, line) for pattern in contact_patterns)
+            is_contact_info = _CONTACT_INFO_RE.search(line) is not None
             
             # Stop processing if we hit a definite signature marker
             if is_definite_signature:
@@ -346,7 +492,7 @@ We apologize for any inconvenience.
                 continue
             
             # Skip lines that are just name/title formatting (like "*Edward Ajayi | MSEAI 26'*")
-            if re.match(r'^\*.*\|.*\*$', line) or re.match(r'^\*.*\*$', line):
+            if _NAME_TITLE_RE.match(line):
                 signature_started = True
                 break
             
@@ -356,24 +502,17 @@ We apologize for any inconvenience.
         question = ' '.join(question_lines).strip()
         
         # Remove any remaining artifacts
-        question = re.sub(r'\s+', ' ', question)  # Multiple spaces to single space
-        question = re.sub(r'^(Hello,?|Hi,?)\s*', '', question, flags=re.IGNORECASE)  # Remove greetings
-        question = re.sub(r'\s*(Thanks?|Thank you)\s*$', '', question, flags=re.IGNORECASE)  # Remove trailing thanks
+        question = _WHITESPACE_RE.sub(' ', question)  # Multiple spaces to single space
+        question = _GREETING_RE.sub('', question)  # Remove greetings
+        question = _TRAILING_THANKS_RE.sub('', question)  # Remove trailing thanks
         
         return question.strip()
     
     def _is_hr_question(self, subject: str, body: str) -> bool:
         """Determine if an email is an HR question"""
-        # Simple keyword-based detection
-        hr_keywords = [
-            'hr', 'human resources', 'policy', 'leave', 'vacation', 'pto',
-            'benefits', 'salary', 'hiring', 'onboarding', 'offboarding',
-            'travel', 'expense', 'handbook', 'guidelines', 'faculty',
-            'staff', 'employee', 'cmu africa', 'carnegie mellon'
-        ]
-        
+        # Simple keyword-based detection, all keywords matched in one scan
         text_to_check = f"{subject} {body}".lower()
-        return any(keyword in text_to_check for keyword in hr_keywords)
+        return _HR_KEYWORD_RE.search(text_to_check) is not None
     
     def _ensure_bot_setup(self):
         """Ensure the bot is properly set up with vectorstore"""
@@ -407,6 +546,10 @@ We apologize for any inconvenience.
         self.startup_time = datetime.datetime.now()
         self._mark_existing_emails_as_processed()
         
+        # A previous stop_email_monitoring shut the old pool down
+        if self.worker_pool is None:
+            self.worker_pool = self._new_worker_pool()
+        
         self.monitoring = True
         self.monitor_thread = threading.Thread(target=self._monitor_emails, args=(check_interval,))
         self.monitor_thread.daemon = True
@@ -421,65 +564,305 @@ We apologize for any inconvenience.
                 imap.login(self.username, self.password)
                 imap.select('INBOX')
                 
-                # Get all email IDs to mark as processed
-                status, messages = imap.search(None, 'ALL')
+                # Only the highest existing UID is needed: anything above it is new
+                status, messages = imap.uid('SEARCH', None, _ALL)
                 
                 if status == 'OK' and messages[0]:
-                    email_ids = messages[0].split()
-                    self.processed_emails.update(email_ids)
-                    logger.info(f"📧 Marked {len(email_ids)} existing emails as processed")
+                    email_uids = messages[0].split()
+                    self.startup_uid = max(int(uid) for uid in email_uids)
+                    logger.info(f"📧 Marked {len(email_uids)} existing emails as processed (up to UID {self.startup_uid})")
                 
         except Exception as e:
             logger.error(f"Error marking existing emails: {e}")
     
+    def _is_processed(self, uid: int) -> bool:
+        """Check whether an email UID has already been handled or is being handled"""
+        with self._processed_lock:
+            if uid in self._in_flight:
+                return True
+            if uid in self.recent_processed:
+                self.recent_processed.move_to_end(uid)
+                return True
+            return False
+    
+    def _mark_processed(self, uid: int):
+        """Record an email UID as handled"""
+        with self._processed_lock:
+            self._in_flight.discard(uid)
+            self._remember_processed(uid)
+    
+    def _remember_processed(self, uid: int):
+        """Add a UID to the recent-processed LRU; caller holds the processed lock"""
+        self.recent_processed[uid] = None
+        self.recent_processed.move_to_end(uid)
+        if len(self.recent_processed) > self.recent_processed_size:
+            self.recent_processed.popitem(last=False)
+    
     def _monitor_emails(self, check_interval: int):
         """Monitor for new emails (only process emails received after startup)"""
         logger.info("Email monitoring started...")
         
+        # One IMAP session is kept for the life of the monitor and only
+        # re-established when the server drops it
+        imap = None
+        supports_idle = False
+        failures = 0
+        
         while self.monitoring:
             try:
-                # Connect to IMAP server
-                with imaplib.IMAP4_SSL(self.imap_server) as imap:
-                    imap.login(self.username, self.password)
-                    imap.select('INBOX')
-                    
-                    # Search for all emails (we'll filter by processed status)
-                    status, messages = imap.search(None, 'ALL')
-                    
-                    if status == 'OK' and messages[0]:
-                        email_ids = messages[0].split()
-                        
-                        # Process only new emails (not in processed set)
-                        new_email_ids = [eid for eid in email_ids if eid not in self.processed_emails]
-                        
-                        if new_email_ids:
-                            logger.info(f"📧 Found {len(new_email_ids)} new emails to process")
-                        
-                        for email_id in new_email_ids:
-                            try:
-                                # Fetch email
-                                status, msg_data = imap.fetch(email_id, '(RFC822)')
-                                
-                                if status == 'OK':
-                                    email_body = msg_data[0][1]
-                                    email_message = email.message_from_bytes(email_body)
-                                    
-                                    # Process the email
-                                    self._process_incoming_email(email_message)
-                                    
-                                    # Mark as processed
-                                    self.processed_emails.add(email_id)
-                                    
-                            except Exception as e:
-                                logger.error(f"Error processing email {email_id}: {e}")
-                                # Still mark as processed to avoid reprocessing
-                                self.processed_emails.add(email_id)
+                if imap is None:
+                    imap = self._connect_imap()
+                    supports_idle = self._supports_idle(imap)
+                    if supports_idle:
+                        logger.info("📧 IMAP IDLE supported, waiting for push notifications")
+                else:
+                    # Keepalive; also surfaces a dropped session before we rely on it
+                    imap.noop()
+                
+                self._process_new_emails(imap)
+                failures = 0
+                
+                if supports_idle:
+                    # Let the server push new mail instead of sleeping
+                    self._idle_wait(imap)
+                    continue
                     
+            except (imaplib.IMAP4.abort, OSError) as e:
+                logger.warning(f"IMAP connection lost, reconnecting: {e}")
+                self._close_imap(imap)
+                imap = None
+                failures += 1
             except Exception as e:
                 logger.error(f"Error in email monitoring: {e}")
+                failures += 1
+            
+            # Wait before next check, backing off after consecutive failures
+            if self.monitoring:
+                delay = check_interval * 2 ** max(failures - 1, 0)
+                time.sleep(min(delay, self.imap_max_backoff))
+        
+        self._close_imap(imap)
+    
+    def _connect_imap(self) -> imaplib.IMAP4_SSL:
+        """Open, authenticate and select INBOX on a new IMAP session"""
+        imap = imaplib.IMAP4_SSL(self.imap_server, timeout=self.imap_timeout)
+        try:
+            imap.login(self.username, self.password)
+            imap.select('INBOX')
+        except Exception:
+            self._close_imap(imap)
+            raise
+        return imap
+    
+    def _close_imap(self, imap: Optional[imaplib.IMAP4_SSL]):
+        """Log out of an IMAP session without raising"""
+        if imap is None:
+            return
+        try:
+            imap.logout()
+        except Exception:
+            pass
+    
+    def _process_new_emails(self, imap: imaplib.IMAP4_SSL):
+        """Fetch and process emails that haven't been processed yet"""
+        # Let the server narrow the search to unread mail above the startup UID that
+        # arrived since the startup date; "N:*" always includes the newest message,
+        # so the range is re-checked below
+        since_date = self.startup_time.strftime('%d-%b-%Y') if self.startup_time else None
+        criteria = [b'UID %d:*' % (self.startup_uid + 1), _UNSEEN]
+        if since_date:
+            criteria += [_SINCE, since_date.encode()]
+        status, messages = imap.uid('SEARCH', None, *criteria)
+        
+        if status == 'OK' and messages[0]:
+            email_uids = messages[0].split()
             
-            # Wait before next check
-            time.sleep(check_interval)
+            # Process only new emails (not already processed)
+            new_email_ids = [
+                uid for uid in email_uids
+                if int(uid) > self.startup_uid and not self._is_processed(int(uid))
+            ]
+            
+            if new_email_ids:
+                logger.info(f"📧 Found {len(new_email_ids)} new emails to process")
+            
+            # UIDs to flag \Seen, sent in one STORE at the end of the poll
+            seen_batch: List[bytes] = []
+            
+            # Fetch in batches: one round-trip per batch instead of per message
+            for start in range(0, len(new_email_ids), self.fetch_batch_size):
+                batch = self._select_hr_candidates(
+                    imap, new_email_ids[start:start + self.fetch_batch_size], seen_batch
+                )
+                if not batch:
+                    continue
+                
+                status, msg_data = imap.uid('FETCH', b','.join(batch), _RFC822_FETCH)
+                
+                if status != 'OK':
+                    logger.error(f"Error fetching {len(batch)} emails: {msg_data}")
+                    continue
+                
+                for email_id, items in self._iter_fetch_response(msg_data):
+                    email_body = items.get(b'RFC822')
+                    if email_body is None:
+                        continue
+                    with self._processed_lock:
+                        self._in_flight.add(email_id)
+                    self.worker_pool.submit(self._handle_fetched_email, email_id, email_body)
+                    seen_batch.append(str(email_id).encode())
+            
+            if seen_batch:
+                status, data = imap.uid('STORE', b','.join(seen_batch), _ADD_FLAGS, _SEEN_FLAG)
+                if status != 'OK':
+                    logger.warning(f"Could not mark {len(seen_batch)} emails as read: {data}")
+    
+    def _select_hr_candidates(self, imap: imaplib.IMAP4_SSL, batch: List[bytes], seen_batch: List[bytes]) -> List[bytes]:
+        """
+        Preview a batch of emails (subject plus the start of the body) and
+        return the UIDs worth a full fetch. The rest are recorded as processed
+        and added to seen_batch.
+        Bodies that are base64 encoded can't be checked from raw bytes, so they
+        are always kept; on any preview failure the whole batch is kept.
+        """
+        try:
+            status, msg_data = imap.uid('FETCH', b','.join(batch), _PREVIEW_FETCH)
+            if status != 'OK':
+                return batch
+            
+            rejected = set()
+            for email_id, items in self._iter_fetch_response(msg_data):
+                headers = next((v for k, v in items.items() if k.startswith(b'BODY[HEADER')), b'')
+                preview = next((v for k, v in items.items() if k.startswith(b'BODY[TEXT]')), b'')
+                if b'base64' in headers.lower() or b'base64' in preview.lower():
+                    continue
+                
+                subject = email.message_from_bytes(headers).get('Subject', '')
+                if not self._is_hr_question(subject, preview.decode('utf-8', errors='ignore')):
+                    rejected.add(email_id)
+            
+            for email_id in rejected:
+                self._mark_processed(email_id)
+                seen_batch.append(str(email_id).encode())
+            if rejected:
+                logger.info(f"📧 Skipped {len(rejected)} non-HR emails from header preview")
+            
+            return [uid for uid in batch if int(uid) not in rejected]
+            
+        except Exception as e:
+            logger.warning(f"Email preview failed, fetching full messages: {e}")
+            return batch
+    
+    def _iter_fetch_response(self, msg_data: list):
+        """
+        Group a UID FETCH response into (uid, {item name: literal bytes}) per message.
+        Each literal arrives as an (envelope, bytes) tuple; a message ends with a
+        plain bytes element such as b')' that may also carry the UID.
+        """
+        email_id, items = None, {}
+        for part in msg_data:
+            if isinstance(part, tuple):
+                envelope, literal = part
+                uid_match = _FETCH_UID_RE.search(envelope)
+                if uid_match:
+                    email_id = int(uid_match.group(1))
+                item_match = _FETCH_ITEM_RE.search(envelope)
+                if item_match:
+                    items[item_match.group(1).upper()] = literal
+            elif part:
+                uid_match = _FETCH_UID_RE.search(part)
+                if uid_match:
+                    email_id = int(uid_match.group(1))
+                if part.endswith(b')'):
+                    if email_id is not None and items:
+                        yield email_id, items
+                    email_id, items = None, {}
+    
+    def _handle_fetched_email(self, email_id: int, email_body: bytes):
+        """Parse and answer one fetched email on a worker thread"""
+        try:
+            email_message = _EMAIL_PARSER.parsebytes(email_body)
+            
+            # Process the email
+            self._process_incoming_email(self._parse_incoming_email(email_message))
+            
+        except Exception as e:
+            logger.error(f"Error processing email {email_id}: {e}")
+        
+        # Mark as processed, even on error to avoid reprocessing
+        self._mark_processed(email_id)
+    
+    def _supports_idle(self, imap: imaplib.IMAP4_SSL) -> bool:
+        """Check whether the server advertises IDLE once logged in"""
+        status, data = imap.capability()
+        return status == 'OK' and b'IDLE' in data[0].upper().split()
+    
+    def _idle_wait(self, imap: imaplib.IMAP4_SSL) -> bool:
+        """
+        Issue IMAP IDLE and block until the server reports a mailbox change,
+        the IDLE timeout expires or monitoring is stopped.
+        Returns True if the server pushed an update.
+        imaplib has no IDLE support, so the command is sent directly.
+        """
+        # New mail reported during the previous commands needs no IDLE round;
+        # popping also stops these lists growing over a long-lived session
+        pending = [imap.untagged_responses.pop(name, None) for name in ('EXISTS', 'RECENT')]
+        if any(pending):
+            return True
+        
+        tag = imap._new_tag()
+        try:
+            imap.send(tag + b' IDLE\r\n')
+            
+            # Read up to the continuation through imaplib's buffered reader, so
+            # untagged lines it had already buffered are seen rather than skipped
+            updated = False
+            while True:
+                response = imap.readline()
+                if not response:
+                    raise imaplib.IMAP4.abort("connection closed starting IDLE")
+                if response.startswith(b'+'):
+                    break
+                if not response.startswith(b'* '):
+                    raise imaplib.IMAP4.error(f"IDLE rejected: {response!r}")
+                if b'EXISTS' in response or b'RECENT' in response:
+                    updated = True
+            
+            deadline = time.monotonic() + self.idle_timeout
+            while not updated and self.monitoring and time.monotonic() < deadline:
+                # Data already decrypted into the SSL buffer won't wake select
+                if imap.sock.pending() or select.select([imap.sock], [], [], self.idle_check_interval)[0]:
+                    response = self._read_idle_line(imap)
+                    if response.startswith(b'* ') and (b'EXISTS' in response or b'RECENT' in response):
+                        updated = True
+            
+            # End IDLE and drain responses up to the tagged completion
+            imap.send(b'DONE\r\n')
+            while True:
+                response = imap.readline()
+                if not response:
+                    raise imaplib.IMAP4.abort("connection closed ending IDLE")
+                if response.startswith(tag):
+                    break
+        finally:
+            # The completion is read by hand, so imaplib never retires the tag itself
+            imap.tagged_commands.pop(tag, None)
+        
+        return updated
+    
+    def _read_idle_line(self, imap: imaplib.IMAP4_SSL) -> bytes:
+        """
+        Read one response line straight from the socket while idling.
+        imaplib's buffered reader can read ahead past the line, leaving
+        data that select would never report.
+        """
+        line = bytearray()
+        while not line.endswith(b'\n'):
+            chunk = imap.sock.recv(1)
+            if not chunk:
+                raise imaplib.IMAP4.abort("connection closed during IDLE")
+            line += chunk
+        return bytes(line)
     
     def is_configured(self) -> bool:
         """Check if email integration is properly configured"""
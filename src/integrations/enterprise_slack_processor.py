@@ -10,17 +10,36 @@ Production-ready implementation based on Databricks enterprise patterns:
 - Database-level audit trail simulation
 """
 
+import asyncio
+import hashlib
 import logging
+import re
 import threading
 import time
-from datetime import datetime
-from typing import Dict, Set, Optional
+from typing import Dict, Set, Optional, Tuple, TypedDict
 from dataclasses import dataclass
-from queue import Queue, Empty
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_APP_MENTION_RE = re.compile(r'<@[^>]+>\s*')
+
+# Log the 1st, 257th, 513th... prevented duplicate; bursts can be large
+DUPLICATE_LOG_SAMPLE_MASK = 0xFF
+
+WORK_QUEUE_MAX_EVENTS = 1000  # Prevent memory issues
+
+class SlackEventPayload(TypedDict, total=False):
+    """Fields read from the raw Slack ``event`` object"""
+    type: str
+    channel: str
+    user: str
+    text: str
+    ts: str
+    thread_ts: str
+    client_msg_id: str
+
+@dataclass(slots=True, frozen=True)
 class SlackEvent:
     """Professional Slack event data structure"""
     event_id: str
@@ -31,9 +50,12 @@ class SlackEvent:
     timestamp: str = ""
     event_type: str = "message"
     
-    def to_signature(self) -> str:
-        """Create unique signature for deduplication"""
-        return f"{self.user_id}_{self.channel_id}_{self.text[:50]}_{self.timestamp}"
+    def to_signature(self) -> bytes:
+        """Create unique 16-byte signature for deduplication"""
+        return hashlib.blake2b(
+            f"{self.user_id}|{self.channel_id}|{self.text}|{self.timestamp}".encode(),
+            digest_size=16
+        ).digest()
     
     def to_urn(self) -> str:
         """Create URN for audit logging"""
@@ -42,55 +64,89 @@ class SlackEvent:
 class EventAuditStore:
     """Thread-safe event audit store for enterprise-grade deduplication"""
     
+    __slots__ = ('_events', '_max_events', '_events_lock', '_logger')
+    
     def __init__(self, max_events: int = 10000):
-        self._events: Set[str] = set()
-        self._processing: Set[str] = set()
+        self._events: "OrderedDict[str, None]" = OrderedDict()  # Bounded LRU of event ids
         self._max_events = max_events
-        self._lock = threading.RLock()
+        self._events_lock = threading.Lock()  # Guards mutations; membership reads are lock-free
         self._logger = logging.getLogger(f"{__name__}.EventAuditStore")
         
     def is_duplicate_event(self, event_id: str) -> bool:
         """Check if event was already processed"""
-        with self._lock:
-            return event_id in self._events
-    
-    def is_processing(self, signature: str) -> bool:
-        """Check if question is currently being processed"""
-        with self._lock:
-            return signature in self._processing
+        # A single OrderedDict membership probe is atomic under the GIL
+        return event_id in self._events
     
     def mark_event_processed(self, event_id: str) -> None:
         """Mark event as processed"""
-        with self._lock:
-            self._events.add(event_id)
-            if len(self._events) > self._max_events:
-                # Keep only recent half for memory management
-                recent = list(self._events)[-self._max_events//2:]
-                self._events = set(recent)
-                self._logger.info(f"🧹 Cleaned audit store, kept {len(recent)} recent events")
-    
-    def mark_processing_start(self, signature: str) -> bool:
-        """Mark question as being processed. Returns False if already processing."""
-        with self._lock:
-            if signature in self._processing:
-                return False
-            self._processing.add(signature)
-            return True
-    
-    def mark_processing_complete(self, signature: str) -> None:
-        """Mark question processing as complete"""
-        with self._lock:
-            self._processing.discard(signature)
+        with self._events_lock:
+            self._events[event_id] = None
+            self._events.move_to_end(event_id)
+            # Evict least recently seen events for memory management
+            while len(self._events) > self._max_events:
+                self._events.popitem(last=False)
     
     def get_stats(self) -> Dict[str, int]:
         """Get audit store statistics"""
-        with self._lock:
+        with self._events_lock:
             return {
                 "processed_events": len(self._events),
-                "currently_processing": len(self._processing),
                 "max_events": self._max_events
             }
 
+class DedupWorkQueue:
+    """Work queue that coalesces pending items sharing a key and tracks in-flight keys
+    
+    Confined to the processor event loop, so no locking is needed.
+    """
+    
+    __slots__ = ('_keys', '_pending', '_processing')
+    
+    def __init__(self, maxsize: int = 0):
+        self._keys: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._pending: Dict[bytes, SlackEvent] = {}  # Latest payload per queued key
+        self._processing: Set[bytes] = set()
+    
+    def add(self, key: bytes, payload: SlackEvent) -> str:
+        """Queue payload under key. Returns 'queued', 'coalesced' or 'processing'.
+        
+        Raises asyncio.QueueFull when a new key would exceed capacity.
+        """
+        if key in self._processing:
+            return "processing"
+        if key in self._pending:
+            self._pending[key] = payload
+            return "coalesced"
+        self._keys.put_nowait(key)
+        self._pending[key] = payload
+        return "queued"
+    
+    async def get(self) -> Tuple[bytes, SlackEvent]:
+        """Wait for the next key and move it from pending to processing"""
+        key = await self._keys.get()
+        self._processing.add(key)
+        return key, self._pending.pop(key)
+    
+    def get_nowait(self) -> Tuple[bytes, SlackEvent]:
+        """Take the next key without waiting. Raises asyncio.QueueEmpty."""
+        key = self._keys.get_nowait()
+        self._processing.add(key)
+        return key, self._pending.pop(key)
+    
+    def done(self, key: bytes) -> None:
+        """Mark key processing as complete"""
+        self._processing.discard(key)
+        self._keys.task_done()
+    
+    def qsize(self) -> int:
+        return self._keys.qsize()
+    
+    def full(self) -> bool:
+        return self._keys.full()
+    
+    def processing_count(self) -> int:
+        return len(self._processing)
+
 class EnterpriseSlackProcessor:
     """
     Enterprise-grade Slack message processor
@@ -102,105 +158,171 @@ class EnterpriseSlackProcessor:
     - Comprehensive audit trail
     """
     
+    __slots__ = (
+        'bot', 'slack_integration', 'audit_store', 'work_queue', 'processing_thread',
+        'loop', 'worker_task', 'in_flight', 'batch_size', 'bot_concurrency',
+        '_bot_semaphore', 'running', 'logger',
+        '_bot_user_id', '_bot_user_lock', 'n_processed', 'n_queued', 'n_duplicates',
+        'n_errors', 'start_time', '_start_monotonic',
+    )
+    
     def __init__(self, bot, slack_integration):
         self.bot = bot
         self.slack_integration = slack_integration
         self.audit_store = EventAuditStore()
-        self.message_queue = Queue(maxsize=1000)  # Prevent memory issues
-        self.processing_thread = None
+        self.work_queue = DedupWorkQueue(maxsize=WORK_QUEUE_MAX_EVENTS)
+        self.processing_thread = None  # Thread hosting the processor event loop
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.worker_task: Optional[asyncio.Task] = None
+        self.in_flight: Set[asyncio.Task] = set()  # Messages currently being answered
+        self.batch_size = 32  # Max events drained per worker wakeup
+        self.bot_concurrency = 4  # Messages answered at once, bounded by LLM rate limits
+        self._bot_semaphore = asyncio.Semaphore(self.bot_concurrency)
         self.running = False
         self.logger = logging.getLogger(f"{__name__}.EnterpriseSlackProcessor")
+        self._bot_user_id: Optional[str] = None  # Resolved once via auth_test
+        self._bot_user_lock = threading.Lock()
         
-        # Statistics
-        self.stats = {
-            "messages_processed": 0,
-            "messages_queued": 0,
-            "duplicates_prevented": 0,
-            "errors_encountered": 0,
-            "start_time": datetime.now()
-        }
+        # Statistics (plain counters; the dict is built on demand in get_enterprise_stats)
+        self.n_processed = 0
+        self.n_queued = 0
+        self.n_duplicates = 0
+        self.n_errors = 0
+        self.start_time = time.time()  # Wall-clock start (epoch seconds) for display
+        self._start_monotonic = time.monotonic()  # Runtime clock immune to wall-clock steps
         
     def start_processing(self):
         """Start the enterprise message processing system"""
         if self.processing_thread is None or not self.processing_thread.is_alive():
             self.running = True
+            self.loop = asyncio.new_event_loop()
+            # asyncio primitives bind to the first loop that uses them, so a
+            # restart needs fresh ones for the new loop
+            self.work_queue = DedupWorkQueue(maxsize=WORK_QUEUE_MAX_EVENTS)
+            self._bot_semaphore = asyncio.Semaphore(self.bot_concurrency)
+            self.in_flight = set()
+            ready = threading.Event()
             self.processing_thread = threading.Thread(
-                target=self._enterprise_processing_loop, 
+                target=self._run_event_loop,
+                args=(ready,),
                 daemon=True,
                 name="SlackProcessor"
             )
             self.processing_thread.start()
+            ready.wait(timeout=5)
             self.logger.info("🚀 Enterprise Slack processor started")
     
     def stop_processing(self):
         """Gracefully stop the processing system"""
         self.running = False
-        if self.processing_thread:
+        if self.loop and self.processing_thread and self.processing_thread.is_alive():
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout=10)
+            except Exception as e:
+                self.logger.warning(f"⚠️ Enterprise processor shutdown incomplete: {e}")
+            self.loop.call_soon_threadsafe(self.loop.stop)
             self.processing_thread.join(timeout=10)
         self.logger.info("🛑 Enterprise Slack processor stopped")
         self._log_final_stats()
     
-    def _enterprise_processing_loop(self):
+    def _run_event_loop(self, ready: threading.Event):
+        """Run the processor event loop in its dedicated thread"""
+        asyncio.set_event_loop(self.loop)
+        self.worker_task = self.loop.create_task(self._enterprise_processing_loop())
+        self.loop.call_soon(ready.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+    
+    async def _shutdown(self):
+        """Cancel the worker and any in-flight messages"""
+        tasks = [self.worker_task, *self.in_flight] if self.worker_task else list(self.in_flight)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _enterprise_processing_loop(self):
         """Main enterprise processing loop with robust error handling"""
         self.logger.info("📡 Enterprise processing loop started")
         
         while self.running:
             try:
-                # Process messages with timeout to allow graceful shutdown
+                # Take a slot before dequeuing so waiting events stay in the bounded
+                # queue and its capacity limit keeps applying. Cancellation from
+                # _shutdown ends either wait, so no timeout polling is needed.
+                await self._bot_semaphore.acquire()
                 try:
-                    slack_event = self.message_queue.get(timeout=1.0)
-                    self._process_enterprise_message(slack_event)
-                    self.message_queue.task_done()
-                    self.stats["messages_processed"] += 1
-                except Empty:
-                    # Normal timeout - continue loop
-                    continue
-                    
+                    batch = [await self.work_queue.get()]
+                except BaseException:
+                    self._bot_semaphore.release()
+                    raise
+                while len(batch) < self.batch_size and not self._bot_semaphore.locked():
+                    try:
+                        batch.append(self.work_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                    await self._bot_semaphore.acquire()  # A slot is free, so this does not block
+                
+                for signature, slack_event in batch:
+                    task = asyncio.create_task(self._process_queued_message(signature, slack_event))
+                    self.in_flight.add(task)
+                    task.add_done_callback(self.in_flight.discard)
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 self.logger.error(f"❌ Critical error in processing loop: {e}")
-                self.stats["errors_encountered"] += 1
-                time.sleep(1)  # Back off on errors
+                self.n_errors += 1
+                await asyncio.sleep(1)  # Back off on errors
     
-    def _process_enterprise_message(self, slack_event: SlackEvent):
+    async def _process_queued_message(self, signature: bytes, slack_event: SlackEvent):
+        """Process one dequeued message and release its work-queue key"""
+        try:
+            await self._process_enterprise_message(slack_event)
+            self.n_processed += 1
+        finally:
+            # Always clean up processing state and free the slot taken at dequeue
+            self.work_queue.done(signature)
+            self._bot_semaphore.release()
+    
+    async def _process_enterprise_message(self, slack_event: SlackEvent):
         """Process a single message with enterprise-grade reliability"""
+        urn = slack_event.to_urn()
         try:
-            urn = slack_event.to_urn()
-            self.logger.info(f"🔄 Processing enterprise message: {urn}")
+            self.logger.debug("🔄 Processing enterprise message: %s", urn)
             
             # Enterprise-grade bot response generation
             if hasattr(self.bot, 'fast_answer'):
-                result = self.bot.fast_answer(slack_event.text, platform="slack")
+                result = await asyncio.to_thread(self.bot.fast_answer, slack_event.text, platform="slack")
             else:
                 self.logger.error("❌ Bot missing fast_answer method - critical configuration error")
-                self._send_error_response(slack_event, "Bot configuration error")
+                await self._send_error_response(slack_event, "Bot configuration error")
                 return
             
             if result and "answer" in result:
                 # Send professional response
-                success = self.slack_integration.send_message_safe(
+                success = await asyncio.to_thread(
+                    self.slack_integration.send_message_safe,
                     channel=slack_event.channel_id,
                     text=result["answer"],
                     thread_ts=slack_event.thread_ts
                 )
                 
                 if success.get("success"):
-                    self.logger.info(f"✅ Enterprise response delivered: {urn}")
+                    self.logger.debug("✅ Enterprise response delivered: %s", urn)
                     # Mark as processed only after successful delivery
                     self.audit_store.mark_event_processed(slack_event.event_id)
                 else:
-                    self.logger.error(f"❌ Response delivery failed: {urn} - {success.get('error')}")
+                    self.logger.error("❌ Response delivery failed: %s - %s", urn, success.get('error'))
                     self._handle_delivery_failure(slack_event, success.get("error"))
             else:
-                self.logger.warning(f"⚠️ No answer generated for: {urn}")
-                self._send_fallback_response(slack_event)
+                self.logger.warning("⚠️ No answer generated for: %s", urn)
+                await self._send_fallback_response(slack_event)
                 
         except Exception as e:
-            self.logger.error(f"❌ Enterprise processing error for {slack_event.to_urn()}: {e}")
-            self.stats["errors_encountered"] += 1
-            self._send_error_response(slack_event, str(e))
-        finally:
-            # Always clean up processing state
-            self.audit_store.mark_processing_complete(slack_event.to_signature())
+            self.logger.error("❌ Enterprise processing error for %s: %s", urn, e)
+            self.n_errors += 1
+            await self._send_error_response(slack_event, str(e))
     
     def handle_slack_event(self, event_data: Dict) -> Dict[str, str]:
         """
@@ -210,7 +332,7 @@ class EnterpriseSlackProcessor:
         while ensuring reliable message processing
         """
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Extract and validate event
             event = event_data.get("event", {})
@@ -221,8 +343,10 @@ class EnterpriseSlackProcessor:
             
             # CRITICAL: Check for duplicate events first (fastest path)
             if self.audit_store.is_duplicate_event(event_id):
-                self.logger.info(f"🚫 Enterprise duplicate prevention: {event_id}")
-                self.stats["duplicates_prevented"] += 1
+                self.n_duplicates += 1
+                if (self.n_duplicates & DUPLICATE_LOG_SAMPLE_MASK) == 1:
+                    self.logger.info("🚫 Enterprise duplicate prevention: %s (%d prevented so far)",
+                                     event_id, self.n_duplicates)
                 return {"status": "ok", "message": "Duplicate event prevented"}
             
             # Handle relevant event types
@@ -232,50 +356,58 @@ class EnterpriseSlackProcessor:
                     result = self._queue_for_enterprise_processing(slack_event)
                     
                     # Log performance
-                    processing_time = time.time() - start_time
-                    self.logger.info(f"⚡ Event handled in {processing_time:.3f}s")
+                    processing_time = time.monotonic() - start_time
+                    self.logger.debug("⚡ Event handled in %.3fs", processing_time)
                     
                     return result
             
             return {"status": "ok", "message": "Event type ignored"}
             
         except Exception as e:
-            self.logger.error(f"❌ Critical enterprise event handling error: {e}")
+            self.logger.error("❌ Critical enterprise event handling error: %s", e)
             return {"status": "error", "message": "Enterprise handling failed"}
     
     def _generate_event_id(self, event: Dict, event_type: str) -> str:
         """Generate comprehensive event ID for enterprise deduplication"""
-        return (event.get("client_msg_id") or 
-                event.get("ts") or 
-                f"{event_type}_{event.get('user')}_{int(time.time() * 1000000)}")
+        event_id = event.get("client_msg_id")
+        if event_id:
+            return event_id
+        event_id = event.get("ts")
+        if event_id:
+            return event_id
+        # Cold path: Slack normally sends one of the above
+        return f"{event_type}_{event.get('user')}_{time.monotonic_ns()}"
     
-    def _create_slack_event(self, event: Dict, event_id: str) -> Optional[SlackEvent]:
+    def _create_slack_event(self, event: SlackEventPayload, event_id: str) -> Optional[SlackEvent]:
         """Create validated SlackEvent from raw Slack data"""
         try:
+            event_type = event.get("type")
             channel = event.get("channel")
-            text = event.get("text", "")
+            
+            # Cheapest reject first: only process DMs for regular messages
+            if event_type == "message" and not (channel and channel.startswith('D')):
+                self.logger.debug("🚫 Enterprise policy: public messages require @mention")
+                return None
+            
             user_id = event.get("user")
             timestamp = event.get("ts")
-            thread_ts = event.get("thread_ts")
-            event_type = event.get("type")
             
             # Enterprise validation
-            if not all([channel, user_id, timestamp]):
-                self.logger.warning(f"⚠️ Enterprise validation failed: missing required fields")
+            if not (channel and user_id and timestamp):
+                self.logger.warning("⚠️ Enterprise validation failed: missing required fields")
                 return None
             
             # Bot self-exclusion
             if self._is_bot_message(user_id):
-                self.logger.info(f"🚫 Enterprise bot exclusion: {user_id}")
+                self.logger.debug("🚫 Enterprise bot exclusion: %s", user_id)
                 return None
             
+            text = event.get("text", "")
+            thread_ts = event.get("thread_ts")
+            
             # Clean app mentions for professional processing
             if event_type == "app_mention":
                 text = self._clean_app_mention(text)
-            elif event_type == "message" and not channel.startswith('D'):
-                # Only process DMs for regular messages
-                self.logger.info(f"🚫 Enterprise policy: public messages require @mention")
-                return None
             
             return SlackEvent(
                 event_id=event_id,
@@ -288,69 +420,85 @@ class EnterpriseSlackProcessor:
             )
             
         except Exception as e:
-            self.logger.error(f"❌ Enterprise event creation failed: {e}")
+            self.logger.error("❌ Enterprise event creation failed: %s", e)
             return None
     
     def _is_bot_message(self, user_id: str) -> bool:
         """Check if message is from the bot itself"""
-        try:
-            auth_response = self.slack_integration.client.auth_test()
-            bot_user_id = auth_response.get("user_id")
-            return user_id == bot_user_id
-        except Exception as e:
-            self.logger.warning(f"⚠️ Could not verify bot user ID: {e}")
-            return False
+        if self._bot_user_id is None:
+            with self._bot_user_lock:
+                if self._bot_user_id is None:
+                    try:
+                        auth_response = self.slack_integration.client.auth_test()
+                        self._bot_user_id = auth_response.get("user_id")
+                    except Exception as e:
+                        self.logger.warning(f"⚠️ Could not verify bot user ID: {e}")
+                        return False
+        return user_id == self._bot_user_id
     
     def _clean_app_mention(self, text: str) -> str:
         """Clean app mention for professional processing"""
-        import re
-        return re.sub(r'<@[^>]+>\s*', '', text).strip()
+        return _APP_MENTION_RE.sub('', text).strip()
     
     def _queue_for_enterprise_processing(self, slack_event: SlackEvent) -> Dict[str, str]:
         """Queue message for enterprise-grade asynchronous processing"""
         try:
-            signature = slack_event.to_signature()
+            # Hand off to the processor event loop; the work queue handles
+            # question-level deduplication and in-flight tracking
+            outcome = self._submit_to_loop(slack_event.to_signature(), slack_event)
             
-            # Question-level deduplication
-            if self.audit_store.is_processing(signature):
-                self.logger.info(f"🚫 Enterprise question deduplication: already processing")
-                self.stats["duplicates_prevented"] += 1
-                return {"status": "ok", "message": "Question already being processed"}
+            if outcome == "queued":
+                self.n_queued += 1
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("📤 Enterprise queue: %s", slack_event.to_urn())
+                return {"status": "ok", "message": "Queued for enterprise processing"}
             
-            # Mark as processing
-            if not self.audit_store.mark_processing_start(signature):
-                self.logger.info(f"🚫 Enterprise concurrency control: question locked")
-                return {"status": "ok", "message": "Question processing locked"}
+            if outcome in ("coalesced", "processing"):
+                self.n_duplicates += 1
+                if (self.n_duplicates & DUPLICATE_LOG_SAMPLE_MASK) == 1:
+                    self.logger.info("🚫 Enterprise question deduplication: %s (%d prevented so far)",
+                                     outcome, self.n_duplicates)
+                return {"status": "ok", "message": "Question already being processed"}
             
-            # Queue for processing
-            try:
-                self.message_queue.put(slack_event, timeout=1)
-                self.stats["messages_queued"] += 1
-                self.logger.info(f"📤 Enterprise queue: {slack_event.to_urn()}")
-                return {"status": "ok", "message": "Queued for enterprise processing"}
-            except:
-                # Queue full - clean up and return error
-                self.audit_store.mark_processing_complete(signature)
-                return {"status": "error", "message": "Enterprise queue capacity exceeded"}
+            # Queue full or processor not running
+            return {"status": "error", "message": "Enterprise queue capacity exceeded"}
             
         except Exception as e:
-            self.logger.error(f"❌ Enterprise queueing failed: {e}")
-            self.audit_store.mark_processing_complete(slack_event.to_signature())
+            self.logger.error("❌ Enterprise queueing failed: %s", e)
             return {"status": "error", "message": "Enterprise queueing failed"}
     
-    def _send_error_response(self, slack_event: SlackEvent, error: str):
+    def _submit_to_loop(self, signature: bytes, slack_event: SlackEvent) -> str:
+        """Enqueue an event onto the processor loop from the webhook thread"""
+        if not self.running or self.loop is None or self.loop.is_closed():
+            return "stopped"
+        # Fail fast without a loop round-trip; _enqueue still enforces capacity
+        if self.work_queue.full():
+            return "full"
+        future = asyncio.run_coroutine_threadsafe(self._enqueue(signature, slack_event), self.loop)
+        return future.result(timeout=1)
+    
+    async def _enqueue(self, signature: bytes, slack_event: SlackEvent) -> str:
+        """Add an event to the work queue without waiting for capacity"""
+        try:
+            return self.work_queue.add(signature, slack_event)
+        except asyncio.QueueFull:
+            return "full"
+    
+    async def _send_error_response(self, slack_event: SlackEvent, error: str):
         """Send professional error response"""
         error_msg = "I apologize, but I encountered a technical issue while processing your request. Our team has been notified. Please try again in a moment."
-        self.slack_integration.send_message_safe(
+        await asyncio.to_thread(
+            self.slack_integration.send_message_safe,
             channel=slack_event.channel_id,
             text=error_msg,
             thread_ts=slack_event.thread_ts
         )
     
-    def _send_fallback_response(self, slack_event: SlackEvent):
+    async def _send_fallback_response(self, slack_event: SlackEvent):
         """Send professional fallback response"""
         fallback_msg = "I apologize, but I couldn't find information to answer your question. Please contact HR directly for assistance, or try rephrasing your question."
-        self.slack_integration.send_message_safe(
+        await asyncio.to_thread(
+            self.slack_integration.send_message_safe,
             channel=slack_event.channel_id,
             text=fallback_msg,
             thread_ts=slack_event.thread_ts
@@ -363,14 +511,20 @@ class EnterpriseSlackProcessor:
     
     def get_enterprise_stats(self) -> Dict:
         """Get comprehensive enterprise statistics"""
-        runtime = datetime.now() - self.stats["start_time"]
+        runtime_seconds = time.monotonic() - self._start_monotonic
         audit_stats = self.audit_store.get_stats()
         
         return {
-            **self.stats,
-            "runtime_seconds": runtime.total_seconds(),
-            "messages_per_second": self.stats["messages_processed"] / max(runtime.total_seconds(), 1),
-            "queue_size": self.message_queue.qsize(),
+            "messages_processed": self.n_processed,
+            "messages_queued": self.n_queued,
+            "duplicates_prevented": self.n_duplicates,
+            "errors_encountered": self.n_errors,
+            "start_time": self.start_time,
+            "runtime_seconds": runtime_seconds,
+            "messages_per_second": self.n_processed / max(runtime_seconds, 1),
+            "queue_size": self.work_queue.qsize(),
+            "currently_processing": self.work_queue.processing_count(),
+            "in_flight": len(self.in_flight),
             "is_running": self.running,
             **audit_stats
         }
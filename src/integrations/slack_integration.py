@@ -1,15 +1,175 @@
 import os
 import re
 import logging
+import threading
+from functools import lru_cache
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from html import unescape
-import html2text
+from html.parser import HTMLParser
+from typing import List, Optional
+
+from src.utils.slack_markdown import strip_tags_fast
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_EXTRA_NEWLINES_RE = re.compile(r'\n\s*\n\s*\n+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_CACHE_MAX_CHARS = 64 * 1024  # Larger inputs are converted without caching
+_SLACK_MAX_TEXT_CHARS = 3700  # Leaves headroom under Slack's 4000 char message limit
+_SLACK_TRUNCATION_NOTICE = "\n\n... (response truncated for Slack)"
+
+
+class _SlackHTMLConverter(HTMLParser):
+    """Single-pass HTML to Slack mrkdwn converter
+    
+    Emits Slack syntax directly while parsing (headers and bold as *text*,
+    italics as _text_, links as <url|text>, list items as bullets), so no
+    markdown intermediate or regex clean-up passes are needed.
+    """
+    
+    _HEADER_TAGS = frozenset(('h1', 'h2', 'h3', 'h4', 'h5', 'h6'))
+    _BOLD_TAGS = frozenset(('strong', 'b'))
+    _ITALIC_TAGS = frozenset(('em', 'i'))
+    _BLOCK_TAGS = frozenset(('p', 'div', 'section', 'article', 'blockquote', 'table', 'tr', 'hr'))
+    _SKIP_TAGS = frozenset(('script', 'style', 'head', 'title'))
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)  # Entities arrive decoded in handle_data
+    
+    def reset(self):
+        """Reset parser and output state"""
+        super().reset()
+        self._parts: List[str] = []
+        self._link_href: Optional[str] = None
+        self._link_parts: Optional[List[str]] = None  # Text collected inside <a>
+        self._lists: List[List] = []  # [tag, item_count] per open ul/ol
+        self._skip_depth = 0
+        self._pre_depth = 0
+    
+    def _emit(self, text: str):
+        if self._link_parts is not None:
+            self._link_parts.append(text)
+        else:
+            self._parts.append(text)
+    
+    def _at_line_start(self) -> bool:
+        parts = self._link_parts if self._link_parts is not None else self._parts
+        return not parts or parts[-1].endswith('\n')
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self._HEADER_TAGS:
+            self._emit('\n\n*')
+        elif tag in self._BOLD_TAGS:
+            self._emit('*')
+        elif tag in self._ITALIC_TAGS:
+            self._emit('_')
+        elif tag == 'a':
+            self._link_href = dict(attrs).get('href')
+            self._link_parts = []
+        elif tag == 'br':
+            self._emit('\n')
+        elif tag in ('ul', 'ol'):
+            if not self._lists:
+                self._emit('\n')
+            self._lists.append([tag, 0])
+        elif tag == 'li':
+            indent = '  ' * max(len(self._lists) - 1, 0)
+            if self._lists and self._lists[-1][0] == 'ol':
+                self._lists[-1][1] += 1
+                self._emit(f"\n{indent}{self._lists[-1][1]}. ")
+            else:
+                self._emit(f"\n{indent}• ")
+        elif tag == 'pre':
+            self._pre_depth += 1
+            self._emit('\n\n```\n')
+        elif tag == 'code' and not self._pre_depth:
+            self._emit('`')
+        elif tag in self._BLOCK_TAGS:
+            self._emit('\n\n')
+    
+    def handle_startendtag(self, tag, attrs):
+        # Void elements such as <br/> and <hr/> have no matching end tag
+        self.handle_starttag(tag, attrs)
+    
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in self._HEADER_TAGS:
+            self._emit('*\n\n')
+        elif tag in self._BOLD_TAGS:
+            self._emit('*')
+        elif tag in self._ITALIC_TAGS:
+            self._emit('_')
+        elif tag == 'a' and self._link_parts is not None:
+            text = ''.join(self._link_parts).strip()
+            href = self._link_href
+            self._link_parts = None
+            self._link_href = None
+            if href and href.startswith(('http://', 'https://', 'mailto:')):
+                self._emit(f"<{href}|{text}>" if text else f"<{href}>")
+            else:
+                self._emit(text)
+        elif tag in ('ul', 'ol'):
+            if self._lists:
+                self._lists.pop()
+            if not self._lists:
+                self._emit('\n\n')
+        elif tag == 'pre':
+            self._pre_depth = max(self._pre_depth - 1, 0)
+            self._emit('\n```\n\n')
+        elif tag == 'code' and not self._pre_depth:
+            self._emit('`')
+        elif tag in self._BLOCK_TAGS:
+            self._emit('\n\n')
+    
+    def handle_data(self, data):
+        if self._skip_depth:
+            return
+        if not self._pre_depth:
+            # Collapse HTML whitespace the way a browser would
+            data = _WHITESPACE_RE.sub(' ', data)
+            if self._at_line_start():
+                data = data.lstrip()
+            if not data:
+                return
+        self._emit(data)
+    
+    def get_text(self) -> str:
+        """Return the converted text with blank-line runs collapsed"""
+        if self._link_parts is not None:
+            # Unclosed <a>: keep its text
+            self._parts.extend(self._link_parts)
+            self._link_parts = None
+        return _EXTRA_NEWLINES_RE.sub('\n\n', ''.join(self._parts)).strip()
+
+
+_converter_local = threading.local()  # One reusable converter per thread
+
+
+def _convert_html_to_slack(html_content: str) -> str:
+    """Run the single-pass converter over html_content"""
+    converter = getattr(_converter_local, 'converter', None)
+    if converter is None:
+        converter = _converter_local.converter = _SlackHTMLConverter()
+    try:
+        converter.feed(html_content)
+        converter.close()
+        return converter.get_text()
+    finally:
+        # Leave it clean for the next call and release the output buffers
+        converter.reset()
+
+
+@lru_cache(maxsize=512)
+def _html_to_slack_cached(html_content: str) -> str:
+    """Cached conversion; identical FAQ answers are rendered once"""
+    return _convert_html_to_slack(html_content)
+
 
 class SlackIntegration:
     """Slack integration for the HR Policy Bot"""
@@ -32,42 +192,9 @@ class SlackIntegration:
     def html_to_slack_text(self, html_content: str) -> str:
         """Convert HTML content to clean Slack-compatible text"""
         try:
-            # Initialize html2text converter
-            h = html2text.HTML2Text()
-            h.ignore_links = False  # Keep links but format them for Slack
-            h.body_width = 0  # Don't wrap lines
-            h.ignore_images = True
-            h.ignore_emphasis = False
-            
-            # Convert HTML to markdown first
-            markdown_text = h.handle(html_content)
-            
-            # Clean up the markdown for Slack formatting
-            # Remove extra newlines and clean up formatting
-            cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', markdown_text)
-            
-            # Convert markdown headers to Slack format
-            cleaned_text = re.sub(r'^### (.*?)$', r'*\1*', cleaned_text, flags=re.MULTILINE)
-            cleaned_text = re.sub(r'^## (.*?)$', r'*\1*', cleaned_text, flags=re.MULTILINE)
-            cleaned_text = re.sub(r'^# (.*?)$', r'*\1*', cleaned_text, flags=re.MULTILINE)
-            
-            # Convert markdown links to Slack format
-            cleaned_text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<\2|\1>', cleaned_text)
-            
-            # Clean up bullet points for Slack
-            cleaned_text = re.sub(r'^\* ', '• ', cleaned_text, flags=re.MULTILINE)
-            
-            # Remove any remaining HTML tags that might have been missed
-            cleaned_text = re.sub(r'<[^>]+>', '', cleaned_text)
-            
-            # Unescape HTML entities
-            cleaned_text = unescape(cleaned_text)
-            
-            # Clean up extra whitespace
-            cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_text)
-            cleaned_text = cleaned_text.strip()
-            
-            return cleaned_text
+            if len(html_content) < _HTML_CACHE_MAX_CHARS:
+                return _html_to_slack_cached(html_content)
+            return _convert_html_to_slack(html_content)
             
         except Exception as e:
             logger.error(f"Error converting HTML to Slack text: {e}")
@@ -75,13 +202,15 @@ class SlackIntegration:
             return self.strip_html_fallback(html_content)
     
     def strip_html_fallback(self, html_content: str) -> str:
-        """Fallback method to strip HTML tags if html2text fails"""
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', html_content)
+        """Fallback method to strip HTML tags if the HTML converter fails"""
+        text = html_content
+        # Remove HTML tags (the substring probes skip work for plain text)
+        text = strip_tags_fast(text)
         # Unescape HTML entities
-        text = unescape(text)
+        if '&' in text:
+            text = unescape(text)
         # Clean up extra whitespace
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = _EXTRA_NEWLINES_RE.sub('\n\n', text)
         return text.strip()
     
     def format_for_slack(self, text: str) -> str:
@@ -89,14 +218,15 @@ class SlackIntegration:
         # The bot now uses LLM for formatting, this is just a fallback
         return text.strip()
     
-    def remove_duplicates(self, text: str) -> str:
-        """Remove duplicate content from the response"""
+    def remove_duplicates(self, text: str, max_len: Optional[int] = None) -> str:
+        """Remove duplicate content from the response, truncating it past max_len chars"""
         # Split the text into sections by double newlines
         sections = text.split('\n\n')
         
         # Remove duplicate sections
         seen_sections = set()
         unique_sections = []
+        total = 0  # Length of the joined output so far
         
         for section in sections:
             # Normalize the section for comparison (remove extra whitespace)
@@ -109,7 +239,16 @@ class SlackIntegration:
             # Skip if we've seen this content before
             if normalized not in seen_sections:
                 seen_sections.add(normalized)
+                # Account for the '\n\n' joiner before every section but the first
+                joiner = 2 if unique_sections else 0
+                if max_len is not None and total + joiner + len(section) > max_len:
+                    # Stop here; later sections would only be cut off by Slack's limit
+                    room = max_len - total - joiner
+                    if room > 0:
+                        unique_sections.append(section[:room])
+                    return '\n\n'.join(unique_sections) + _SLACK_TRUNCATION_NOTICE
                 unique_sections.append(section)
+                total += joiner + len(section)
         
         return '\n\n'.join(unique_sections)
     
@@ -120,16 +259,12 @@ class SlackIntegration:
                 logger.error("Slack client not initialized")
                 return False
             
-            # Remove duplicates first
-            deduplicated_text = self.remove_duplicates(text)
+            # Remove duplicates first, truncating long messages for Slack (4000 char limit)
+            deduplicated_text = self.remove_duplicates(text, max_len=_SLACK_MAX_TEXT_CHARS)
             
             # Format the text for Slack
             formatted_text = self.format_for_slack(deduplicated_text)
             
-            # Truncate very long messages for Slack (4000 char limit)
-            if len(formatted_text) > 3800:
-                formatted_text = formatted_text[:3700] + "\n\n... (response truncated for Slack)"
-            
             response = self.client.chat_postMessage(
                 channel=channel,
                 text=formatted_text,
@@ -284,13 +419,11 @@ class SlackIntegration:
                 result["guidance"].append("Check SLACK_BOT_TOKEN environment variable")
                 return result
             
-            # Remove duplicates first
-            deduplicated_text = self.remove_duplicates(text)
+            # Remove duplicates and truncate text
+            deduplicated_text = self.remove_duplicates(text, max_len=_SLACK_MAX_TEXT_CHARS)
             
-            # Format and truncate text
+            # Format text
             formatted_text = self.format_for_slack(deduplicated_text)
-            if len(formatted_text) > 3800:
-                formatted_text = formatted_text[:3700] + "\n\n... (response truncated for Slack)"
             
             response = self.client.chat_postMessage(
                 channel=channel,
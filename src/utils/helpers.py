@@ -1,6 +1,9 @@
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 try:
@@ -12,15 +15,47 @@ except ImportError:
     except ImportError:
         GoogleSearch = None
 
+# Prefer the C-backed lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    _SOUP_PARSER = "lxml"
+except ImportError:
+    _SOUP_PARSER = "html.parser"
+
 load_dotenv()
 
+_CMU_AFRICA_KEYWORDS = [
+    "rwanda", "kigali", "rw", "cmu-africa"
+]
+_PAGE_FETCH_WORKERS = 8
+_PAGE_MAX_BYTES = 64 * 1024  # Enough markup to yield the 2000 chars of text we keep
+
+# Shared session so page fetches reuse pooled TCP/TLS connections
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_maxsize=_PAGE_FETCH_WORKERS))
+_HTTP_SESSION.mount("http://", HTTPAdapter(pool_maxsize=_PAGE_FETCH_WORKERS))
+
+# One case-insensitive pass over the text instead of lower() plus a scan per keyword
+_CMU_AFRICA_RE = re.compile('|'.join(map(re.escape, _CMU_AFRICA_KEYWORDS)), re.IGNORECASE)
+
+_UNAVAILABLE_KEYWORDS = [
+    "not available",
+    "not in the context",
+    "i'm sorry",
+    "i am sorry",
+    "no information",
+    "can't answer",
+    "cannot answer",
+    "insufficient context",
+    "don't have information",
+    "unable to find",
+    "the text does not provide"
+]
+_UNAVAILABLE_RE = re.compile('|'.join(map(re.escape, _UNAVAILABLE_KEYWORDS)), re.IGNORECASE)
+
 def is_cmu_africa_relevant(text: str) -> bool:
     """Check if the text content is relevant to cmu-africa"""
-    cmu_africa_keywords = [
-        "rwanda", "kigali", "rw", "cmu-africa"
-    ]
-    text_lower = text.lower()
-    return any(keyword in text_lower for keyword in cmu_africa_keywords)
+    return _CMU_AFRICA_RE.search(text) is not None
 
 
 def google_search(query: str, num_results: int = 3, add_cmu_africa_context: bool = True) -> str:
@@ -64,10 +99,14 @@ def google_search(query: str, num_results: int = 3, add_cmu_africa_context: bool
         results = search.get_dict()
         snippets = []
         
-        for res in results.get("organic_results", []):
-            link = res.get("link", "")
-            snippet = extract_page_text(link)
-            
+        # Fetch all result pages concurrently; map() keeps search-result order
+        links = [res.get("link", "") for res in results.get("organic_results", [])]
+        page_texts = []
+        if links:
+            with ThreadPoolExecutor(max_workers=min(_PAGE_FETCH_WORKERS, len(links))) as executor:
+                page_texts = list(executor.map(extract_page_text, links))
+        
+        for snippet in page_texts:
             # Only include CMU-Africa-relevant content
             if snippet and is_cmu_africa_relevant(snippet):
                 snippets.append(snippet)
@@ -78,11 +117,9 @@ def google_search(query: str, num_results: int = 3, add_cmu_africa_context: bool
         
         # If we don't have enough CMU-Africa-specific results, fall back to all results
         if len(snippets) < num_results:
-            for res in results.get("organic_results", []):
+            for snippet in page_texts:
                 if len(snippets) >= num_results:
                     break
-                link = res.get("link", "")
-                snippet = extract_page_text(link)
                 if snippet and snippet not in snippets:
                     snippets.append(snippet)
     
@@ -96,26 +133,22 @@ def google_search(query: str, num_results: int = 3, add_cmu_africa_context: bool
 
 def extract_page_text(url: str) -> str:
     try:
-        response = requests.get(url, timeout=10)
-        soup = BeautifulSoup(response.text, "html.parser")
+        # Stream the body and stop once enough markup has arrived
+        with _HTTP_SESSION.get(url, timeout=10, stream=True) as response:
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=8192):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= _PAGE_MAX_BYTES:
+                    break
+            html = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+        soup = BeautifulSoup(html, _SOUP_PARSER)
         return soup.get_text()[:2000]  # Trim long pages
     except Exception:
         return ""
 
 
 def is_answer_unavailable(answer: str) -> bool:
-    keywords = [
-        "not available",
-        "not in the context",
-        "i'm sorry",
-        "i am sorry",
-        "no information",
-        "can't answer",
-        "cannot answer",
-        "insufficient context",
-        "don't have information",
-        "unable to find",
-        "the text does not provide"
-    ]
     return False
-    # return any(kw in answer.lower() for kw in keywords)
\ No newline at end of file
+    # return bool(_UNAVAILABLE_RE.search(answer))
\ No newline at end of file
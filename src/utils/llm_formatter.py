@@ -5,19 +5,15 @@ Uses the LLM to intelligently convert content to appropriate formats
 Much simpler than regex-based approaches!
 """
 
+import re
 from typing import List, Dict, Any
 
-class LLMFormatter:
-    """LLM-based intelligent formatter for different platforms"""
-    
-    def __init__(self, llm):
-        """Initialize with LLM instance"""
-        self.llm = llm
-    
-    def format_for_slack(self, html_content: str, sources: List[Dict] = None) -> str:
-        """Use LLM to convert HTML to clean Slack format"""
-        
-        prompt = f"""Convert this HTML content to clean, professional Slack format.
+from src.utils.slack_markdown import display_doc_name, fix_slack_markdown
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Static halves of the LLM prompts; the HTML is spliced in between on each call
+_SLACK_PROMPT_PREFIX = """Convert this HTML content to clean, professional Slack format.
 
 CRITICAL SLACK FORMATTING RULES:
 - Use *text* for bold (single asterisks, NOT double)
@@ -49,21 +45,50 @@ Slack: *Travel Requirements*
 You must *complete* the <https://example.com|form>.
 
 HTML Content to convert:
-{html_content}
+"""
+_SLACK_PROMPT_SUFFIX = """
+
+Convert to proper Slack format (use single asterisks for bold, <URL|Text> for links, and remove any document references):"""
+
+_EMAIL_PROMPT_PREFIX = """Convert this HTML content to a professional email format.
+
+EMAIL FORMATTING RULES:
+- Start with a professional greeting if appropriate
+- Use clear subject-like headers
+- Use proper paragraphs with line breaks
+- Convert links to descriptive text with URLs
+- Use bullet points with - or bullets
+- Keep professional, formal tone
+- End with helpful closing if appropriate
+- Remove all HTML tags
+- Structure like a proper business email
+
+HTML Content to convert:
+"""
+_EMAIL_PROMPT_SUFFIX = """
+
+Convert to professional email format:"""
 
-Convert to proper Slack format (use single asterisks for bold, <URL|Text> for links, and remove any document references):""""""
+
+class LLMFormatter:
+    """LLM-based intelligent formatter for different platforms"""
+    
+    def __init__(self, llm):
+        """Initialize with LLM instance"""
+        self.llm = llm
+    
+    def format_for_slack(self, html_content: str, sources: List[Dict] = None) -> str:
+        """Use LLM to convert HTML to clean Slack format"""
+        
+        prompt = ''.join((_SLACK_PROMPT_PREFIX, html_content, _SLACK_PROMPT_SUFFIX))
 
         try:
             response = self.llm.invoke(prompt)
             slack_content = response.content.strip()
             
             # Post-process to fix any remaining markdown issues
-            # Fix double asterisks to single asterisks
-            import re
-            slack_content = re.sub(r'\*\*([^*]+)\*\*', r'*\1*', slack_content)
-            
-            # Fix markdown links to Slack format
-            slack_content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<\2|\1>', slack_content)
+            # Fix double asterisks to single asterisks and markdown links to Slack format
+            slack_content = fix_slack_markdown(slack_content)
             
             # Add sources if provided
             if sources:
@@ -74,30 +99,13 @@ Convert to proper Slack format (use single asterisks for bold, <URL|Text> for li
             
         except Exception as e:
             # Fallback: simple HTML tag removal
-            import re
-            fallback = re.sub(r'<[^>]+>', '', html_content)
+            fallback = _HTML_TAG_RE.sub('', html_content)
             return fallback.strip()
     
     def format_for_email(self, html_content: str, sources: List[Dict] = None) -> str:
         """Use LLM to convert HTML to professional email format"""
         
-        prompt = f"""Convert this HTML content to a professional email format.
-
-EMAIL FORMATTING RULES:
-- Start with a professional greeting if appropriate
-- Use clear subject-like headers
-- Use proper paragraphs with line breaks
-- Convert links to descriptive text with URLs
-- Use bullet points with - or bullets
-- Keep professional, formal tone
-- End with helpful closing if appropriate
-- Remove all HTML tags
-- Structure like a proper business email
-
-HTML Content to convert:
-{html_content}
-
-Convert to professional email format:"""
+        prompt = ''.join((_EMAIL_PROMPT_PREFIX, html_content, _EMAIL_PROMPT_SUFFIX))
 
         try:
             response = self.llm.invoke(prompt)
@@ -112,8 +120,7 @@ Convert to professional email format:"""
             
         except Exception as e:
             # Fallback: simple HTML tag removal
-            import re
-            fallback = re.sub(r'<[^>]+>', '', html_content)
+            fallback = _HTML_TAG_RE.sub('', html_content)
             return fallback.strip()
     
     def _format_slack_sources(self, sources: List[Dict]) -> str:
@@ -139,17 +146,15 @@ Convert to professional email format:"""
                     seen_sources.add(clean_filename)
                     
                     # Clean name for display
-                    doc_name = clean_filename.replace('.pdf', '').replace('-', ' ').replace('_', ' ').title()
+                    doc_name = display_doc_name(clean_filename)
                     
                     # Simple document name without URL
                     sources_list.append(doc_name)
             
             if sources_list:
-                return f"""
-
----
-*Reference Documents:*
-{chr(10).join(f'• {source}' for source in sources_list)}"""
+                parts = ['\n\n---\n*Reference Documents:*']
+                parts.extend(f'\n• {source}' for source in sources_list)
+                return ''.join(parts)
                 
         except Exception:
             pass
@@ -183,16 +188,15 @@ Convert to professional email format:"""
                     url = get_document_url(filename, doc_type)
                     
                     # Clean name
-                    doc_name = clean_filename.replace('.pdf', '').replace('-', ' ').replace('_', ' ').title()
+                    doc_name = display_doc_name(clean_filename)
                     
                     # Email format with visible URL
                     sources_list.append(f"• {doc_name}: {url}")
             
             if sources_list:
-                return f"""
-
-Reference Documents:
-{chr(10).join(sources_list)}"""
+                parts = ['\n\nReference Documents:']
+                parts.extend(f'\n{source}' for source in sources_list)
+                return ''.join(parts)
                 
         except Exception:
             pass
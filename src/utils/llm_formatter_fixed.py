@@ -5,22 +5,21 @@ Simple LLM-Based Intelligent Formatter
 Uses the LLM to intelligently convert content to appropriate formats
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import re
+import threading
 
-class LLMFormatter:
-    """LLM-based intelligent formatter for different platforms"""
-    
-    def __init__(self, llm):
-        """Initialize with LLM instance"""
-        self.llm = llm
-    
-    def format_for_slack(self, html_content: str, sources: List[Dict] = None, always_add_directory: bool = False) -> str:
-        """Use LLM to convert HTML to clean, professional Slack format. Optionally always add the official directory link as a source."""
-        # This function remains as it was, as it was not part of the problem.
-        # ... (code for slack formatting is unchanged) ...
-        cleaned_html = re.sub(r'(Reference Document[s]?|Source Document[s]?|See document[s]?|According to [^.,\n]+|As stated in [^.,\n]+|The document indicates|The policy states|\b[A-Z][a-z]+\.pdf\b|\b[A-Z][a-z]+\.txt\b|\b[A-Z][a-z]+\.csv\b|\b[A-Z][a-z]+ Handbook\b|\b[A-Z][a-z]+ Guide\b)[^\n]*', '', html_content, flags=re.IGNORECASE)
-        prompt = f"""Convert this HTML content to clean, professional Slack format.
+from src.utils.slack_markdown import display_doc_name, fix_slack_markdown, strip_tags_fast
+
+_DOCUMENT_REFERENCE_RE = re.compile(r'(Reference Document[s]?|Source Document[s]?|See document[s]?|According to [^.,\n]+|As stated in [^.,\n]+|The document indicates|The policy states|\b[A-Z][a-z]+\.pdf\b|\b[A-Z][a-z]+\.txt\b|\b[A-Z][a-z]+\.csv\b|\b[A-Z][a-z]+ Handbook\b|\b[A-Z][a-z]+ Guide\b)[^\n]*', re.IGNORECASE)
+_DOUBLE_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_MAILTO_LINK_RE = re.compile(r'<mailto:[^>|]+\|([^>]+)>')
+_BOLD_LINE_RE = re.compile(r'\*\*.+\*\*')
+
+# Static halves of the Slack prompt; the HTML is spliced in between on each call
+_SLACK_PROMPT_PREFIX = """Convert this HTML content to clean, professional Slack format.
 
 CRITICAL SLACK FORMATTING RULES:
 - Use *text* for bold (single asterisks, NOT double)
@@ -54,32 +53,93 @@ SLACK MARKDOWN SYNTAX:
 - NOT: [Link Text](https://example.com)
 
 HTML Content to convert:
-{cleaned_html}
+"""
+_SLACK_PROMPT_SUFFIX = """
 
 Return ONLY the converted content with no preambles or explanations:"""
+
+# LLM-formatted Slack bodies keyed by (LLM config, content digest). Module-level
+# because the bot creates a fresh LLMFormatter for every answer.
+_SLACK_BODY_CACHE_SIZE = 256
+_slack_body_cache: "OrderedDict[Tuple[tuple, bytes], str]" = OrderedDict()
+_slack_body_cache_lock = threading.Lock()
+
+
+def _llm_cache_identity(llm) -> Optional[tuple]:
+    """Describe an LLM by class, model name and temperature, or None if the model is unknown"""
+    # Unlike id(llm), this can't be reused by an unrelated LLM after the first is freed
+    model = getattr(llm, 'model_name', None) or getattr(llm, 'model', None)
+    if not isinstance(model, str):
+        return None
+    return (type(llm).__qualname__, model, getattr(llm, 'temperature', None))
+
+
+class LLMFormatter:
+    """LLM-based intelligent formatter for different platforms"""
+    
+    def __init__(self, llm):
+        """Initialize with LLM instance"""
+        self.llm = llm
+    
+    def format_for_slack(self, html_content: str, sources: List[Dict] = None, always_add_directory: bool = False) -> str:
+        """Use LLM to convert HTML to clean, professional Slack format. Optionally always add the official directory link as a source."""
+        cleaned_html = _DOCUMENT_REFERENCE_RE.sub('', html_content)
         try:
-            response = self.llm.invoke(prompt)
-            slack_content = response.content.strip()
-            # Remove common preambles that the LLM might add
-            preamble_patterns = [ "Here is the converted content", "Here's the converted content", "Slack format:" ]
-            for pattern in preamble_patterns:
-                if slack_content.lower().startswith(pattern.lower()):
-                    slack_content = re.sub(f'^{re.escape(pattern)}:?', '', slack_content, flags=re.IGNORECASE).strip()
-                    break
-            
-            slack_content = re.sub(r'\*\*([^*]+)\*\*', r'*\1*', slack_content)
-            slack_content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<\2|\1>', slack_content)
-            slack_content = re.sub(r'<mailto:[^>|]+\|([^>]+)>', r'\1', slack_content)
+            # Identical answers skip the LLM call; sources are still added fresh below
+            llm_identity = _llm_cache_identity(self.llm)
+            if llm_identity is None:
+                slack_content = self._llm_format_slack_body(cleaned_html)
+            else:
+                cache_key = (llm_identity, hashlib.blake2b(cleaned_html.encode(), digest_size=16).digest())
+                slack_content = self._get_cached_slack_body(cache_key)
+                if slack_content is None:
+                    slack_content = self._llm_format_slack_body(cleaned_html)
+                    self._cache_slack_body(cache_key, slack_content)
 
             sources_text = self._format_slack_sources(sources, always_add_directory=always_add_directory)
             if sources_text:
                 slack_content += sources_text
             return slack_content
         except Exception as e:
-            fallback = re.sub(r'<[^>]+>', '', html_content)
+            fallback = strip_tags_fast(html_content)
             return fallback.strip()
 
 
+    def _llm_format_slack_body(self, cleaned_html: str) -> str:
+        """Run the Slack conversion prompt through the LLM and fix up its markdown"""
+        prompt = ''.join((_SLACK_PROMPT_PREFIX, cleaned_html, _SLACK_PROMPT_SUFFIX))
+        response = self.llm.invoke(prompt)
+        slack_content = response.content.strip()
+        # Remove common preambles that the LLM might add
+        preamble_patterns = [ "Here is the converted content", "Here's the converted content", "Slack format:" ]
+        for pattern in preamble_patterns:
+            if slack_content.lower().startswith(pattern.lower()):
+                slack_content = re.sub(f'^{re.escape(pattern)}:?', '', slack_content, flags=re.IGNORECASE).strip()
+                break
+        
+        slack_content = fix_slack_markdown(slack_content)
+        if '<mailto:' in slack_content:
+            slack_content = _MAILTO_LINK_RE.sub(r'\1', slack_content)
+        return slack_content
+
+    @staticmethod
+    def _get_cached_slack_body(cache_key: Tuple[tuple, bytes]) -> Optional[str]:
+        """Return a cached Slack body and mark it recently used"""
+        with _slack_body_cache_lock:
+            slack_content = _slack_body_cache.get(cache_key)
+            if slack_content is not None:
+                _slack_body_cache.move_to_end(cache_key)
+            return slack_content
+
+    @staticmethod
+    def _cache_slack_body(cache_key: Tuple[tuple, bytes], slack_content: str) -> None:
+        """Store a Slack body, evicting the least recently used entry"""
+        with _slack_body_cache_lock:
+            _slack_body_cache[cache_key] = slack_content
+            _slack_body_cache.move_to_end(cache_key)
+            while len(_slack_body_cache) > _SLACK_BODY_CACHE_SIZE:
+                _slack_body_cache.popitem(last=False)
+
     def format_professional_email(self, email_body: str, html_content: str, sources: List[Dict] = None) -> str:
         """
         Creates a full, professional, and robust HTML email response using a reliable template.
@@ -191,17 +251,17 @@ Return ONLY the converted content with no preambles or explanations:"""
                     clean_item = item.strip().lstrip('•- ').strip()
                     if clean_item:
                         # Convert **bold** to <strong>
-                        clean_item = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', clean_item)
+                        clean_item = _DOUBLE_BOLD_RE.sub(r'<strong>\1</strong>', clean_item)
                         html_parts.append(f'<li style="margin-bottom: 8px;">{clean_item}</li>')
                 html_parts.append('</ul>')
             # Handle headers (lines with just bold text)
-            elif re.fullmatch(r'\*\*.+\*\*', p):
+            elif _BOLD_LINE_RE.fullmatch(p):
                  header_text = p.strip('*')
                  html_parts.append(f'<h3 style="color: #1e3a8a; font-size: 18px; margin-top: 24px; margin-bottom: 12px;">{header_text}</h3>')
             # Handle regular paragraphs
             else:
                 # Convert **bold** to <strong> within paragraphs
-                p = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', p)
+                p = _DOUBLE_BOLD_RE.sub(r'<strong>\1</strong>', p)
                 html_parts.append(f'<p style="margin-top: 0; margin-bottom: 16px;">{p}</p>')
 
         return "\n".join(html_parts)
@@ -225,7 +285,7 @@ Return ONLY the converted content with no preambles or explanations:"""
                 if clean_filename not in seen_sources:
                     seen_sources.add(clean_filename)
                     url = get_document_url(filename, doc_type)
-                    doc_name = clean_filename.replace('.pdf', '').replace('-', ' ').replace('_', ' ').title()
+                    doc_name = display_doc_name(clean_filename)
                     
                     sources_list.append(f"""
 <li style="margin-bottom: 10px;">
@@ -269,13 +329,13 @@ Return ONLY the converted content with no preambles or explanations:"""
                     try:
                         from src.utils.pdf_url_mapping import get_document_url
                         url = get_document_url(filename, doc_type)
-                        doc_name = clean_filename.replace('.pdf', '').replace('-', ' ').replace('_', ' ').title()
+                        doc_name = display_doc_name(clean_filename)
                         if url and url.startswith(('http://', 'https://')):
                             sources_list.append(f"• <{url}|{doc_name}>")
                         else:
                             sources_list.append(f"• {doc_name}")
                     except Exception:
-                        doc_name = clean_filename.replace('.pdf', '').replace('-', ' ').replace('_', ' ').title()
+                        doc_name = display_doc_name(clean_filename)
                         sources_list.append(f"• {doc_name}")
             # Always add the official directory link for name queries if requested
             if always_add_directory:
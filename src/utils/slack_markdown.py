@@ -0,0 +1,51 @@
+"""
+Slack Markdown Helpers
+======================
+Small text helpers shared by the LLM formatters and the Slack integration
+"""
+
+import re
+
+_DOUBLE_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_DOC_NAME_TRANS = str.maketrans('-_', '  ')
+
+
+def fix_slack_markdown(text: str) -> str:
+    """Convert leftover **bold** and [text](url) markup to Slack syntax"""
+    # The LLM is asked for Slack syntax, so usually there is nothing to fix
+    if '**' in text or '](' in text:
+        text = _DOUBLE_BOLD_RE.sub(r'*\1*', text)
+        text = _MD_LINK_RE.sub(r'<\2|\1>', text)
+    return text
+
+
+def display_doc_name(clean_filename: str) -> str:
+    """Turn a source filename into a title-cased display name"""
+    return clean_filename.replace('.pdf', '').translate(_DOC_NAME_TRANS).title()
+
+
+def strip_tags_fast(text: str) -> str:
+    """Remove tags matching <[^>]+> using str.find scans instead of a regex"""
+    if '<' not in text:
+        return text
+    out = []
+    i = 0
+    n = len(text)
+    while i < n:
+        j = text.find('<', i)
+        if j < 0:
+            out.append(text[i:])
+            break
+        k = text.find('>', j + 1)
+        if k < 0:
+            # Unclosed '<' is literal text
+            out.append(text[i:])
+            break
+        if k == j + 1:
+            # '<>' is not a tag; keep it and continue after it
+            out.append(text[i:k + 1])
+        else:
+            out.append(text[i:j])
+        i = k + 1
+    return ''.join(out)